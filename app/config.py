@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     neo4j_uri: str = ""
     neo4j_username: str = ""
     neo4j_password: str = ""
+    neo4j_database: str = ""  # Empty = server default database
+    neo4j_max_connection_pool_size: int = 100  # Per uvicorn worker; workers x pool should cover peak concurrency
+    neo4j_connection_acquisition_timeout: float = 10.0  # Seconds to wait for a pooled connection before failing
+    neo4j_max_connection_lifetime: int = 600  # Seconds; recycle connections before cloud load balancers drop them
     factcheck_api_key: str = ""  # Falls back to gemini_api_key if unset (Fact Check Tools API)
     twelvelabs_api_key: str = ""
     twelvelabs_index_id: str = ""
@@ -1,10 +1,13 @@
 """In-memory graph state + WebSocket ConnectionManager."""
 import asyncio
 import logging
+from bisect import bisect_left, insort
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, TYPE_CHECKING
+from typing import Any, Iterable, TYPE_CHECKING
+
+from pydantic_core import to_json
 
 from app.models.graph import EdgeType, GraphEdge, GraphNode, NodeType
 from app.utils.ids import generate_edge_id, generate_node_id
@@ -17,26 +20,83 @@ logger = logging.getLogger(__name__)
 _controller: "BlackboardController | None" = None
 _reports: dict[str, dict[str, Any]] = {}  # case_id -> report data
 _nodes: dict[str, GraphNode] = {}
-_edges: list[GraphEdge] = []
+_edges: dict[str, GraphEdge] = {}  # edge_id -> edge, in insertion order
 _adjacency: dict[str, list[str]] = defaultdict(list)  # source_id -> [target_ids]
 _case_reports: dict[str, list[str]] = defaultdict(list)  # case_id -> [report_ids]
+# Secondary indexes kept in step with _nodes/_edges so per-case reads skip full scans.
+# Inner dicts act as insertion-ordered sets, preserving the order of the old scans.
+_nodes_by_case: dict[str, dict[str, None]] = defaultdict(dict)  # case_id -> node_ids
+_nodes_by_case_and_type: dict[tuple[str, NodeType], dict[str, None]] = defaultdict(dict)
+_edges_by_case: dict[str, dict[str, GraphEdge]] = defaultdict(dict)  # case_id -> {edge_id: edge}
+_edges_by_node: dict[str, dict[str, None]] = defaultdict(dict)  # node_id -> ids of edges touching it
+# Report nodes per case kept sorted by (timestamp, node_id) for the story view
+_timeline_by_case: dict[str, list[tuple[str, str]]] = defaultdict(list)
+_timeline_keys: dict[str, tuple[str, str]] = {}  # node_id -> its entry in _timeline_by_case
+_version = 0  # Bumped on every mutation; lets readers cache derived views
+_node_versions: dict[str, int] = {}  # node_id -> _version when the node or its one-hop view last changed
+_case_versions: dict[str, int] = {}  # case_id -> _version when any of its nodes or edges last changed
+
+
+def bump_version() -> None:
+    """Mark the graph as changed. Called by every mutating helper below."""
+    global _version
+    _version += 1
+
+
+def get_version() -> int:
+    return _version
+
+
+def _touch(*node_ids: str) -> None:
+    """Stamp nodes with the current graph version (call after bump_version).
+
+    Stamps come from the global counter, so they never repeat even across clear_all.
+    """
+    for nid in node_ids:
+        _node_versions[nid] = _version
+
+
+def get_node_version(node_id: str) -> int:
+    """Version of a node's one-hop view (the node, its edges, and neighbour titles)."""
+    return _node_versions.get(node_id, 0)
+
+
+def get_case_version(case_id: str) -> int:
+    """Version of a case's nodes and edges; unlike get_version, other cases don't move it."""
+    return _case_versions.get(case_id, 0)
 
 
 @dataclass
 class ConnectionManager:
-    """Manages WebSocket connections for caseboard and alerts."""
+    """Manages WebSocket connections for caseboard and alerts.
+
+    Caseboard clients either subscribe to every case (caseboard_connections)
+    or join a single case's room, in which case they only receive updates
+    for that case_id.
+    """
 
     caseboard_connections: set[Any] = field(default_factory=set)
+    caseboard_rooms: dict[str, set[Any]] = field(default_factory=dict)
     alert_connections: set[Any] = field(default_factory=set)
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
-    async def connect_caseboard(self, websocket: Any) -> None:
+    async def connect_caseboard(self, websocket: Any, case_id: str | None = None) -> None:
         async with self._lock:
-            self.caseboard_connections.add(websocket)
+            if case_id:
+                self.caseboard_rooms.setdefault(case_id, set()).add(websocket)
+            else:
+                self.caseboard_connections.add(websocket)
 
-    async def disconnect_caseboard(self, websocket: Any) -> None:
+    async def disconnect_caseboard(self, websocket: Any, case_id: str | None = None) -> None:
         async with self._lock:
-            self.caseboard_connections.discard(websocket)
+            if case_id:
+                room = self.caseboard_rooms.get(case_id)
+                if room is not None:
+                    room.discard(websocket)
+                    if not room:
+                        del self.caseboard_rooms[case_id]
+            else:
+                self.caseboard_connections.discard(websocket)
 
     async def connect_alert(self, websocket: Any) -> None:
         async with self._lock:
@@ -46,48 +106,140 @@ class ConnectionManager:
         async with self._lock:
             self.alert_connections.discard(websocket)
 
-    async def broadcast_caseboard(self, message: dict[str, Any]) -> None:
-        dead: set[Any] = set()
-        async with self._lock:
-            conns = set(self.caseboard_connections)
-        for ws in conns:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                dead.add(ws)
-        for ws in dead:
-            async with self._lock:
-                self.caseboard_connections.discard(ws)
+    async def broadcast_caseboard(self, message: dict[str, Any], case_id: str | None = None) -> None:
+        """Send to all-case subscribers plus the room for case_id (if any)."""
+        targets = [self.caseboard_connections]
+        if case_id:
+            room = self.caseboard_rooms.get(case_id)
+            if room:
+                targets.append(room)
+        await self._broadcast(targets, message)
 
     async def broadcast_alert(self, message: dict[str, Any]) -> None:
+        await self._broadcast([self.alert_connections], message)
+
+    async def _broadcast(self, targets: list[set[Any]], message: dict[str, Any]) -> None:
+        """Encode the message once and fan the same frame out to every socket."""
         dead: set[Any] = set()
         async with self._lock:
-            conns = set(self.alert_connections)
+            conns = set().union(*targets)
+        if not conns:
+            return
+        text = to_json(message).decode()
         for ws in conns:
             try:
-                await ws.send_json(message)
+                await ws.send_text(text)
             except Exception:
                 dead.add(ws)
-        for ws in dead:
+        if dead:
             async with self._lock:
-                self.alert_connections.discard(ws)
+                for connections in targets:
+                    connections -= dead
 
 
 connection_manager = ConnectionManager()
 
 
-def add_node(node: GraphNode) -> None:
+def _display_title(node: GraphNode) -> str:
+    data = node.data
+    return data.get("title") or (data.get("text_body") or "")[:50] or node.node_type.value
+
+
+def _timeline_insert(node: GraphNode) -> None:
+    # Reports without a timestamp sort at the moment they entered the graph
+    ts = node.data.get("timestamp")
+    key = (str(ts) if ts is not None else node.created_at.isoformat(), node.id)
+    insort(_timeline_by_case[node.case_id], key)
+    _timeline_keys[node.id] = key
+
+
+def _timeline_remove(node: GraphNode) -> None:
+    key = _timeline_keys.pop(node.id, None)
+    if key is None:
+        return
+    timeline = _timeline_by_case[node.case_id]
+    i = bisect_left(timeline, key)
+    if i < len(timeline) and timeline[i] == key:
+        del timeline[i]
+
+
+def _unindex_node(node: GraphNode) -> None:
+    _nodes_by_case[node.case_id].pop(node.id, None)
+    _nodes_by_case_and_type[(node.case_id, node.node_type)].pop(node.id, None)
+    _timeline_remove(node)
+
+
+def _insert_node(node: GraphNode) -> None:
+    """Store and index one node, stamping it with the current version (caller bumps)."""
+    node.display_title = _display_title(node)
+    previous = _nodes.get(node.id)
+    if previous is not None:
+        _unindex_node(previous)
     _nodes[node.id] = node
+    _nodes_by_case[node.case_id][node.id] = None
+    _nodes_by_case_and_type[(node.case_id, node.node_type)][node.id] = None
+    if node.node_type == NodeType.REPORT:
+        _timeline_insert(node)
+    _touch(node.id)
+    _case_versions[node.case_id] = _version
+    if previous is not None and previous.case_id != node.case_id:
+        _case_versions[previous.case_id] = _version
 
 
-def add_edge(edge: GraphEdge) -> None:
-    _edges.append(edge)
+def add_node(node: GraphNode) -> None:
+    bump_version()
+    _insert_node(node)
+
+
+def add_nodes_bulk(nodes: Iterable[GraphNode]) -> None:
+    """add_node for many nodes under a single version bump."""
+    bump_version()
+    for node in nodes:
+        _insert_node(node)
+
+
+def _insert_edge(edge: GraphEdge) -> None:
+    """Store and index one edge, stamping its endpoints with the current version (caller bumps)."""
+    _edges[edge.id] = edge
+    _edges_by_case[edge.case_id][edge.id] = edge
+    _edges_by_node[edge.source_id][edge.id] = None
+    _edges_by_node[edge.target_id][edge.id] = None
     _adjacency[edge.source_id].append(edge.target_id)
+    _touch(edge.source_id, edge.target_id)
+    _case_versions[edge.case_id] = _version
 
 
-def update_node(node_id: str, data_updates: dict[str, Any]) -> None:
-    if node_id in _nodes:
-        _nodes[node_id].data.update(data_updates)
+def add_edge(edge: GraphEdge) -> None:
+    bump_version()
+    _insert_edge(edge)
+
+
+def add_edges_bulk(edges: Iterable[GraphEdge]) -> None:
+    """add_edge for many edges under a single version bump."""
+    bump_version()
+    for edge in edges:
+        _insert_edge(edge)
+
+
+def update_node(node_id: str, data_updates: dict[str, Any]) -> GraphNode | None:
+    """Merge data_updates into the node's data in place. Returns the updated node (None if missing)."""
+    node = _nodes.get(node_id)
+    if node is not None:
+        if "timestamp" in data_updates and node.id in _timeline_keys:
+            _timeline_remove(node)
+            node.data.update(data_updates)
+            _timeline_insert(node)
+        else:
+            node.data.update(data_updates)
+        bump_version()
+        _touch(node_id)
+        _case_versions[node.case_id] = _version
+        if "title" in data_updates or "text_body" in data_updates:
+            node.display_title = _display_title(node)
+            # Neighbours render this node's title in their inference panels
+            for e in get_edges_for_node(node_id):
+                _touch(e.source_id, e.target_id)
+    return node
 
 
 def delete_node(node_id: str) -> dict[str, Any]:
@@ -96,20 +248,21 @@ def delete_node(node_id: str) -> dict[str, Any]:
         raise ValueError(f"Node {node_id} not found")
 
     # Find all connected edges
-    edges_to_delete = [
-        e for e in _edges
-        if e.source_id == node_id or e.target_id == node_id
-    ]
+    edges_to_delete = [_edges[eid] for eid in _edges_by_node.pop(node_id, ())]
 
-    # Delete edges first
-    for edge in edges_to_delete:
-        _edges.remove(edge)
-
-    # Remove from adjacency
+    # Delete edges first, unhooking each from the other endpoint's indexes
     _adjacency.pop(node_id, None)
-    for neighbors in _adjacency.values():
-        if node_id in neighbors:
-            neighbors.remove(node_id)
+    for edge in edges_to_delete:
+        del _edges[edge.id]
+        _edges_by_case[edge.case_id].pop(edge.id, None)
+        other = edge.target_id if edge.source_id == node_id else edge.source_id
+        other_edges = _edges_by_node.get(other)
+        if other_edges is not None:
+            other_edges.pop(edge.id, None)
+        if edge.target_id == node_id:
+            neighbors = _adjacency.get(edge.source_id)
+            if neighbors and node_id in neighbors:
+                neighbors.remove(node_id)
 
     # Remove from case reports tracking
     for case_id, report_ids in _case_reports.items():
@@ -118,6 +271,13 @@ def delete_node(node_id: str) -> dict[str, Any]:
 
     # Delete node
     node = _nodes.pop(node_id)
+    _unindex_node(node)
+    bump_version()
+    for e in edges_to_delete:
+        _touch(e.source_id, e.target_id)
+        _case_versions[e.case_id] = _version
+    _node_versions.pop(node_id, None)
+    _case_versions[node.case_id] = _version
 
     return {
         "deleted_node": node_id,
@@ -130,27 +290,57 @@ def get_node(node_id: str) -> GraphNode | None:
     return _nodes.get(node_id)
 
 
+def get_nodes_bulk(node_ids: Iterable[str]) -> dict[str, GraphNode]:
+    """Resolve many ids in one pass. Missing ids are omitted; nodes are live references."""
+    nodes = _nodes
+    return {nid: nodes[nid] for nid in node_ids if nid in nodes}
+
+
+def get_two_nodes_in_case(
+    source_id: str, target_id: str, case_id: str
+) -> tuple[GraphNode | None, GraphNode | None, str | None]:
+    """Look up both endpoints of a prospective edge and check case membership.
+
+    Returns (source, target, error) where error is one of "source_missing",
+    "target_missing", "case_mismatch" or None.
+    """
+    source = _nodes.get(source_id)
+    if source is None:
+        return None, None, "source_missing"
+    target = _nodes.get(target_id)
+    if target is None:
+        return source, None, "target_missing"
+    if source.case_id != case_id or target.case_id != case_id:
+        return source, target, "case_mismatch"
+    return source, target, None
+
+
 def get_nodes_for_case(case_id: str) -> list[GraphNode]:
-    return [n for n in _nodes.values() if n.case_id == case_id]
+    ids = _nodes_by_case.get(case_id)
+    return [_nodes[i] for i in ids] if ids else []
 
 
 def get_nodes_by_type(case_id: str, node_type: NodeType) -> list[GraphNode]:
-    return [n for n in _nodes.values() if n.case_id == case_id and n.node_type == node_type]
+    ids = _nodes_by_case_and_type.get((case_id, node_type))
+    return [_nodes[i] for i in ids] if ids else []
 
 
 def get_external_source_by_query(case_id: str, search_query: str) -> GraphNode | None:
     """Return existing external_source node with same search_query if any."""
     q = (search_query or "")[:500]
-    for n in _nodes.values():
-        if n.case_id == case_id and n.node_type == NodeType.EXTERNAL_SOURCE:
-            if (n.data.get("search_query") or "")[:500] == q:
-                return n
+    for n in get_nodes_by_type(case_id, NodeType.EXTERNAL_SOURCE):
+        if (n.data.get("search_query") or "")[:500] == q:
+            return n
     return None
 
 
 def get_edges_for_node(node_id: str) -> list[GraphEdge]:
-    outgoing = [e for e in _edges if e.source_id == node_id]
-    incoming = [e for e in _edges if e.target_id == node_id]
+    ids = _edges_by_node.get(node_id)
+    if not ids:
+        return []
+    edges = [_edges[eid] for eid in ids]
+    outgoing = [e for e in edges if e.source_id == node_id]
+    incoming = [e for e in edges if e.target_id == node_id]
     return outgoing + incoming
 
 
@@ -194,8 +384,15 @@ def get_reports_with_phash(exclude_id: str | None = None) -> list[GraphNode]:
     return result
 
 
+def get_case_timeline(case_id: str) -> list[GraphNode]:
+    """Report nodes for a case, already ordered by timestamp."""
+    timeline = _timeline_by_case.get(case_id)
+    return [_nodes[nid] for _, nid in timeline] if timeline else []
+
+
 def get_edges_for_case(case_id: str) -> list[GraphEdge]:
-    return [e for e in _edges if e.case_id == case_id]
+    edges = _edges_by_case.get(case_id)
+    return list(edges.values()) if edges else []
 
 
 def get_all_cases() -> list[dict[str, Any]]:
@@ -255,7 +452,7 @@ def get_all_cases() -> list[dict[str, Any]]:
                     cases[n.case_id]["story"] += "\n\n" + entry
                 else:
                     cases[n.case_id]["story"] = entry
-    for e in _edges:
+    for e in _edges.values():
         if e.case_id not in cases:
             cases[e.case_id] = {
                 "case_id": e.case_id,
@@ -299,8 +496,7 @@ def get_all_reports() -> list[dict[str, Any]]:
     return list(_reports.values())
 
 
-def add_report(case_id: str, report_id: str, report_data: dict[str, Any], report_node_id: str | None = None) -> None:
-    """Store report and link to case."""
+def _store_report(case_id: str, report_id: str, report_data: dict[str, Any], report_node_id: str | None) -> None:
     report_data["case_id"] = case_id
     report_data["report_id"] = report_id
     if report_node_id:
@@ -309,6 +505,19 @@ def add_report(case_id: str, report_id: str, report_data: dict[str, Any], report
     _case_reports[case_id].append(report_id)
 
 
+def add_report(case_id: str, report_id: str, report_data: dict[str, Any], report_node_id: str | None = None) -> None:
+    """Store report and link to case."""
+    _store_report(case_id, report_id, report_data, report_node_id)
+    bump_version()
+
+
+def add_reports_bulk(reports: Iterable[tuple[str, str, dict[str, Any], str | None]]) -> None:
+    """add_report for many (case_id, report_id, report_data, report_node_id) rows under one version bump."""
+    for case_id, report_id, report_data, report_node_id in reports:
+        _store_report(case_id, report_id, report_data, report_node_id)
+    bump_version()
+
+
 def get_case_snapshot(case_id: str) -> dict[str, Any] | None:
     nodes = get_nodes_for_case(case_id)
     edges = get_edges_for_case(case_id)
@@ -400,14 +609,15 @@ def _event_type_from_action(action: str, payload: dict[str, Any]) -> str:
     return action
 
 
-async def broadcast_graph_update(action: str, payload: dict[str, Any]) -> None:
+async def broadcast_graph_update(action: str, payload: dict[str, Any], case_id: str | None = None) -> None:
+    """Send a graph_update to subscribers of the payload's case and notify the controller."""
     msg = {
         "type": "graph_update",
         "action": action,
         "payload": payload,
         "timestamp": datetime.utcnow().isoformat(),
     }
-    await connection_manager.broadcast_caseboard(msg)
+    await connection_manager.broadcast_caseboard(msg, case_id or payload.get("case_id"))
     if _controller:
         event_type = _event_type_from_action(action, payload)
         try:
@@ -416,12 +626,37 @@ async def broadcast_graph_update(action: str, payload: dict[str, Any]) -> None:
             logger.warning("Controller notify failed: %s", e)
 
 
+async def broadcast_graph_batch(action: str, case_id: str, payloads: list[dict[str, Any]]) -> None:
+    """Send one caseboard message for a batch (add_nodes / add_edges).
+
+    The controller is still notified per item, using the singular action
+    (add_node / add_edge), so knowledge sources see the same events as for
+    individual writes.
+    """
+    msg = {
+        "type": "graph_update",
+        "action": action,
+        "payload": {"case_id": case_id, "items": payloads},
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+    await connection_manager.broadcast_caseboard(msg, case_id)
+    if _controller:
+        item_action = action.removesuffix("s")
+        for payload in payloads:
+            event_type = _event_type_from_action(item_action, payload)
+            try:
+                asyncio.create_task(_controller.notify(event_type, payload))
+            except Exception as e:
+                logger.warning("Controller notify failed: %s", e)
+
+
 _case_metadata: dict[str, dict[str, Any]] = {}  # case_id -> {label, status, location, summary, story, updated_at}
 
 
 def set_case_metadata(case_id: str, metadata: dict[str, Any]) -> None:
     """Store extra case metadata (label, status, location, summary, story) for seed data."""
     _case_metadata[case_id] = metadata
+    bump_version()
 
 
 def get_case_metadata(case_id: str) -> dict[str, Any] | None:
@@ -436,6 +671,15 @@ def clear_all() -> None:
     _adjacency.clear()
     _case_reports.clear()
     _case_metadata.clear()
+    _node_versions.clear()
+    _case_versions.clear()
+    _nodes_by_case.clear()
+    _nodes_by_case_and_type.clear()
+    _edges_by_case.clear()
+    _edges_by_node.clear()
+    _timeline_by_case.clear()
+    _timeline_keys.clear()
+    bump_version()
 
 
 def create_and_add_node(
@@ -0,0 +1,90 @@
+"""Background job queue for slow upstream calls (forensics), using asyncio.Queue."""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+WORKER_COUNT = 2
+# Jobs waiting for a worker; enqueue raises asyncio.QueueFull beyond this
+MAX_QUEUED_JOBS = 100
+MAX_TRACKED_JOBS = 1000
+# On shutdown, let queued and running jobs finish for this long before cancelling them
+DRAIN_TIMEOUT_SECONDS = 30.0
+
+_queue: asyncio.Queue[tuple[str, JobFactory]] | None = None
+_workers: list[asyncio.Task] = []
+_jobs: dict[str, str] = {}  # job_id -> pending | running | done | failed
+
+
+async def enqueue(job_id: str, factory: JobFactory) -> None:
+    """Queue a job; factory() is awaited by a worker.
+
+    Raises RuntimeError if the queue is not running and asyncio.QueueFull when
+    MAX_QUEUED_JOBS are already waiting.
+    """
+    if _queue is None:
+        raise RuntimeError("Job queue not started")
+    # Raises before any status is recorded, so a rejected job leaves no trace
+    _queue.put_nowait((job_id, factory))
+    if len(_jobs) >= MAX_TRACKED_JOBS:
+        # Forget the oldest finished jobs; unfinished ones are bounded by the queue size
+        for jid in [j for j, st in _jobs.items() if st in ("done", "failed")][: MAX_TRACKED_JOBS // 2]:
+            del _jobs[jid]
+    _jobs[job_id] = "pending"
+
+
+def get_job_status(job_id: str) -> str | None:
+    """pending | running | done | failed, or None for unknown (or already pruned) ids."""
+    return _jobs.get(job_id)
+
+
+async def _worker_loop() -> None:
+    """Pull jobs and run them one at a time."""
+    assert _queue is not None
+    while True:
+        try:
+            job_id, factory = await _queue.get()
+        except asyncio.CancelledError:
+            break
+        _jobs[job_id] = "running"
+        try:
+            await factory()
+            _jobs[job_id] = "done"
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            _jobs[job_id] = "failed"
+            logger.exception("Job %s failed: %s", job_id, e)
+        finally:
+            _queue.task_done()
+
+
+async def start_job_queue() -> None:
+    """Start the job queue workers."""
+    global _queue
+    _queue = asyncio.Queue(maxsize=MAX_QUEUED_JOBS)
+    _workers[:] = [asyncio.create_task(_worker_loop()) for _ in range(WORKER_COUNT)]
+    logger.info("Job queue started (%d workers)", WORKER_COUNT)
+
+
+async def stop_job_queue() -> None:
+    """Let queued jobs finish (up to DRAIN_TIMEOUT_SECONDS), then stop the workers."""
+    global _queue
+    if _queue is not None:
+        try:
+            await asyncio.wait_for(_queue.join(), timeout=DRAIN_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning("Job queue drain timed out; cancelling %d queued job(s)", _queue.qsize())
+    for task in _workers:
+        task.cancel()
+    for task in _workers:
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+    _workers.clear()
+    _queue = None
+    logger.info("Job queue stopped")
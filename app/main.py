@@ -7,7 +7,9 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.event_bus import start_event_bus, stop_event_bus
-from app.routers import reports, cases, alerts, ws, seed, files
+from app.job_queue import start_job_queue, stop_job_queue
+from app.routers import reports, cases, alerts, ws, seed, files, jobs
+from app.utils.responses import FastJSONResponse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,11 +17,13 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Start event bus, Backboard assistants, Neo4j, blackboard controller; stop on shutdown."""
+    """Start event bus, job queue, Backboard assistants, Groq client, Neo4j, blackboard controller; stop on shutdown."""
     await start_event_bus()
+    await start_job_queue()
     from app.graph_state import set_controller
     from app.pipelines.orchestrator import register_knowledge_sources
-    from app.services.backboard_client import get_or_create_assistants
+    from app.services import groq
+    from app.services.backboard_client import close_client as close_backboard_client, get_or_create_assistants
     from app.services.graph_db import GraphDatabase
 
     if getattr(settings, "backboard_api_key", ""):
@@ -31,10 +35,13 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("BACKBOARD_API_KEY not set — forensic analysis will use fallback scores")
 
+    # Shared AsyncGroq client: built once here instead of on the first chat request
+    groq.get_async_client()
+
     # Neo4j AuraDB: connect and verify
     graph_db = GraphDatabase.get_instance()
     if graph_db.driver:
-        if graph_db.verify_connection():
+        if await graph_db.verify_connection():
             logger.info("Neo4j connection verified (RETURN 1 OK)")
         else:
             logger.warning("Neo4j connection verify failed")
@@ -44,8 +51,13 @@ async def lifespan(app: FastAPI):
     controller.start()
     logger.info("Shadow Bureau backend started (blackboard: %d sources)", controller.source_count)
     yield
-    graph_db.close()
+    # Stop producers first: pipelines and job workers use the clients closed below
     await controller.stop()
+    await stop_job_queue()
+    await cases.drain_background_tasks()
+    await graph_db.close()
+    await groq.close_async_client()
+    await close_backboard_client()
     await stop_event_bus()
     logger.info("Shadow Bureau backend stopped")
 
@@ -55,6 +67,7 @@ app = FastAPI(
     description="Noir-themed campus intelligence platform",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 app.add_middleware(
@@ -71,6 +84,7 @@ app.include_router(alerts.router)
 app.include_router(ws.router)
 app.include_router(seed.router)
 app.include_router(files.router)
+app.include_router(jobs.router)
 
 
 @app.get("/health")
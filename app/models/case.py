@@ -46,6 +46,12 @@ class EvidenceOut(BaseModel):
     timestamp: Optional[str] = None
 
 
+class ReviewPatch(BaseModel):
+    """Request body for PATCH /api/cases/{case_id}/evidence/{evidence_id}."""
+
+    reviewed: bool = False
+
+
 class EdgeCreate(BaseModel):
     """Request body for POST /api/cases/{case_id}/edges (Red String — link two nodes)."""
 
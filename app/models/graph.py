@@ -41,6 +41,7 @@ class GraphNode(BaseModel):
     case_id: str
     data: dict[str, Any] = Field(default_factory=dict)
     created_at: datetime = Field(default_factory=datetime.utcnow)
+    display_title: str = ""  # Derived from data on write (see graph_state)
 
 
 class GraphEdge(BaseModel):
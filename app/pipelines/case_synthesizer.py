@@ -3,7 +3,7 @@ import json
 import logging
 from typing import Any
 
-from app.graph_state import broadcast_graph_update, get_case_snapshot, get_node, get_nodes_by_type, update_node
+from app.graph_state import broadcast_graph_update, get_case_snapshot, get_nodes_by_type, update_node
 from app.models.graph import NodeType
 from app.services import ai, backboard_client
 
@@ -35,7 +35,7 @@ async def run_case_synthesizer(payload: dict[str, Any]) -> None:
         return
     report_nodes = get_nodes_by_type(case_id, NodeType.REPORT)
     for node in report_nodes:
-        update_node(node.id, {
+        updated = update_node(node.id, {
             "case_narrative": synthesis.get("narrative", ""),
             "origin_analysis": synthesis.get("origin_analysis", ""),
             "spread_map": synthesis.get("spread_map", ""),
@@ -44,7 +44,6 @@ async def run_case_synthesizer(payload: dict[str, Any]) -> None:
             else synthesis.get("confidence_assessment"),
             "recommended_action": synthesis.get("recommended_action", ""),
         })
-        updated = get_node(node.id)
         if updated:
             await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
     if synthesis.get("narrative"):
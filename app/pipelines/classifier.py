@@ -34,11 +34,10 @@ async def run_classifier(payload: dict[str, Any]) -> None:
     for node in report_nodes:
         role, confidence = _classify_node(node, report_nodes)
         if role:
-            update_node(node.id, {
+            updated = update_node(node.id, {
                 "semantic_role": role.value,
                 "role_confidence": confidence,
             })
-            updated = get_node(node.id)
             if updated:
                 await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
 
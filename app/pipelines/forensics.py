@@ -176,8 +176,7 @@ async def _process_image(
             edge = create_and_add_edge(EdgeType.MUTATION_OF, report_node_id, other.id, case_id, {"hamming": dist})
             await broadcast_graph_update("add_edge", edge.model_dump(mode="json"))
 
-    update_node(report_node_id, data)
-    updated = get_node(report_node_id)
+    updated = update_node(report_node_id, data)
     if updated:
         await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
 
@@ -255,7 +254,6 @@ async def _process_video(
         "manipulation_indicators": deepfake_scores.get("indicators", []),
         "analyzed_at": datetime.utcnow().isoformat(),
     }
-    update_node(report_node_id, data)
-    updated = get_node(report_node_id)
+    updated = update_node(report_node_id, data)
     if updated:
         await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
@@ -34,7 +34,6 @@ async def run_forensics_xref(payload: dict[str, Any]) -> None:
                 "url": r.get("url", ""),
                 "status": "found",
             })
-    update_node(node_id, {"video_xref": video_xref})
-    updated = get_node(node_id)
+    updated = update_node(node_id, {"video_xref": video_xref})
     if updated:
         await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
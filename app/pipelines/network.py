@@ -80,7 +80,7 @@ async def run_network(
     existing = report_node.data.get("confidence")
     confidence = fc_confidence if existing is None else (float(existing) + fc_confidence) / 2.0
 
-    update_node(report_node_id, {
+    updated = update_node(report_node_id, {
         "claims": claims,
         "urgency": urgency,
         "misinformation_flags": misinformation_flags,
@@ -91,6 +91,5 @@ async def run_network(
         "debunk_count": sum(1 for fc in fact_checks if "false" in (fc.get("rating") or "").lower() or "debunk" in (fc.get("rating") or "").lower()),
         "confidence": min(1.0, max(0.0, confidence)),
     })
-    updated = get_node(report_node_id)
     if updated:
         await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
@@ -21,7 +21,6 @@ async def run_recluster_debunk(payload: dict[str, Any]) -> None:
     for node_id, count in debunk_count.items():
         node = get_node(node_id)
         if node:
-            update_node(node_id, {"debunk_count": count})
-            updated = get_node(node_id)
+            updated = update_node(node_id, {"debunk_count": count})
             if updated:
                 await broadcast_graph_update("update_node", updated.model_dump(mode="json"))
@@ -1,27 +1,131 @@
 """Cases router: GET/POST /api/cases, GET/POST /api/cases/{case_id}, evidence, edges."""
+import asyncio
 import logging
-from typing import Any
+import os
+import re
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from heapq import nlargest
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Mapping
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from neo4j import Session as Neo4jSession
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from neo4j import AsyncSession as Neo4jSession
+from pydantic_core import to_json
 
 from app.config import settings
 from app.event_bus import emit
-from app.graph_state import get_all_cases, get_case_snapshot, create_and_add_node, create_and_add_edge, broadcast_graph_update
-from app.models.case import CaseCreate, CaseOut, EdgeCreate, EdgeOut, EvidenceCreate, EvidenceOut
-from app.models.graph import NodeType, EdgeType
+from app.graph_state import (
+    get_all_cases,
+    get_case_snapshot,
+    get_case_timeline,
+    get_case_version,
+    get_edges_for_case,
+    get_edges_for_node,
+    get_node,
+    get_node_version,
+    get_nodes_bulk,
+    get_two_nodes_in_case,
+    get_version,
+    create_and_add_node,
+    create_and_add_edge,
+    update_node,
+    delete_node,
+    broadcast_graph_update,
+    broadcast_graph_batch,
+)
+from app.job_queue import enqueue
+from app.models.case import CaseCreate, CaseOut, EdgeCreate, EdgeOut, EvidenceCreate, EvidenceOut, ReviewPatch
+from app.models.graph import EdgeType, GraphEdge, NodeType
 from app.services.graph_db import GraphDatabase
-from app.services import graph_queries
+from app.services import ai, backboard_client, elevenlabs, graph_queries, groq, twelvelabs
+from app.utils.ids import generate_evidence_id, generate_job_id
 
 router = APIRouter(prefix="/api", tags=["cases"])
 logger = logging.getLogger(__name__)
 
+# Enum .value goes through descriptor machinery; resolve once for per-edge loops
+_EDGE_TYPE_VALUE: dict[EdgeType, str] = {e: e.value for e in EdgeType}
+
+# Request-string lookups; read-only module constants so handlers don't rebuild them per call
+_EVIDENCE_NODE_TYPES: Mapping[str, NodeType] = MappingProxyType({
+    "text": NodeType.REPORT,
+    "image": NodeType.REPORT,
+    "video": NodeType.REPORT,
+})
+# Red String link types (supports, contradicts, ...) -> EdgeType
+_MANUAL_EDGE_TYPES: Mapping[str, EdgeType] = MappingProxyType({
+    "supports": EdgeType.SIMILAR_TO,
+    "contradicts": EdgeType.DEBUNKED_BY,
+    "related": EdgeType.SIMILAR_TO,
+    "suspected_link": EdgeType.SIMILAR_TO,
+})
+
+# Strong refs to fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks: set[asyncio.Future] = set()
+
+
+def _log_task_errors(task: asyncio.Future) -> None:
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Background task failed: %s", task.exception())
+
+
+def _spawn(aw) -> None:
+    """Run an awaitable off the request path (WS broadcasts, event emits)."""
+    task = asyncio.ensure_future(aw)
+    _background_tasks.add(task)
+    task.add_done_callback(_log_task_errors)
+
+
+async def drain_background_tasks(timeout: float = 10.0) -> None:
+    """Wait for in-flight background writes and broadcasts. Call before closing the Neo4j driver."""
+    if _background_tasks:
+        await asyncio.wait(set(_background_tasks), timeout=timeout)
+
+
+# Background Neo4j writes for one case run in submission order (asyncio.Lock wakes waiters
+# FIFO), so an edge is never written before the evidence it links; different cases write
+# concurrently. A case's lock lives only while it has writes queued or running.
+_neo4j_write_locks: dict[str, asyncio.Lock] = {}
+_neo4j_writes_queued: dict[str, int] = {}
+
+
+async def _persist(write, case_id: str, data: Any, what: str) -> None:
+    """Write to Neo4j off the request path on a fresh session; the in-memory graph already answered."""
+    lock = _neo4j_write_locks.setdefault(case_id, asyncio.Lock())
+    _neo4j_writes_queued[case_id] = _neo4j_writes_queued.get(case_id, 0) + 1
+    try:
+        async with lock:
+            try:
+                async with GraphDatabase.get_instance().session() as session:
+                    await write(session, case_id, data)
+                logger.debug("%s saved to Neo4j for case %s", what, case_id)
+            except Exception as e:
+                logger.warning("Failed to save %s to Neo4j: %s", what, e)
+    finally:
+        if _neo4j_writes_queued[case_id] == 1:
+            del _neo4j_writes_queued[case_id]
+            del _neo4j_write_locks[case_id]
+        else:
+            _neo4j_writes_queued[case_id] -= 1
+
+
+_cases_cache: tuple[int, bytes] | None = None  # (graph version, serialized list_cases body)
+
 
 @router.get("/cases")
 async def list_cases():
-    """List all cases with counts (from in-memory graph)."""
-    return get_all_cases()
+    """List all cases with counts (from in-memory graph). Cached until the graph changes."""
+    global _cases_cache
+    version = get_version()
+    if _cases_cache is None or _cases_cache[0] != version:
+        _cases_cache = (version, to_json(get_all_cases()))
+    return Response(content=_cases_cache[1], media_type="application/json")
 
 
 @router.post("/cases", response_model=CaseOut)
@@ -31,9 +135,9 @@ async def create_case(
 ):
     """Create a new case in Neo4j if available. Returns basic case object if Neo4j not configured."""
     # Try to create in Neo4j if available
-    if session is not None:
+    if session:
         try:
-            result = graph_queries.create_case(
+            result = await graph_queries.create_case(
                 session,
                 case_id=body.case_id,
                 title=body.title,
@@ -53,10 +157,9 @@ async def create_case(
                     created_at=result.get("created_at"),
                 )
         except Exception as e:
-            logger.warning(f"Failed to create case in Neo4j: {e}")
+            logger.warning("Failed to create case in Neo4j: %s", e)
 
     # Fallback: return basic case object (Neo4j not available or failed)
-    from datetime import datetime
     return CaseOut(
         id=body.case_id,
         case_id=body.case_id,
@@ -72,16 +175,17 @@ async def create_case(
 @router.get("/cases/{case_id}/graph")
 async def get_case_graph(
     case_id: str,
-    session: Neo4jSession = Depends(GraphDatabase.get_session),
+    session: Neo4jSession = Depends(GraphDatabase.get_read_session),
 ):
-    """Fetch entire case graph from Neo4j, formatted for React Flow (nodes, edges)."""
-    result = graph_queries.get_case_graph(session, case_id)
-    if result is None:
+    """Stream entire case graph from Neo4j, formatted for React Flow (nodes, edges)."""
+    # Count first so a Neo4j failure still surfaces as a 500 before any bytes are sent
+    n_nodes = await graph_queries.count_case_graph_nodes(session, case_id)
+    if n_nodes is None:
         raise HTTPException(status_code=500, detail="Failed to fetch graph from Neo4j")
-    if not result.get("nodes") and not result.get("edges"):
-        # Case may exist but have no contained nodes
-        return {"nodes": [], "edges": [], "case_id": case_id}
-    return {"nodes": result["nodes"], "edges": result["edges"], "case_id": case_id}
+    return StreamingResponse(
+        graph_queries.stream_case_graph(session, case_id, n_nodes),
+        media_type="application/json",
+    )
 
 
 @router.get("/cases/{case_id}")
@@ -93,21 +197,13 @@ async def get_case(case_id: str):
     return snapshot
 
 
-@router.post("/cases/{case_id}/evidence")
-async def add_evidence(
-    case_id: str,
-    body: EvidenceCreate,
-    request: Request,
-    session: Neo4jSession | None = Depends(GraphDatabase.get_optional_session),
-):
-    """Upload raw evidence; saves to Neo4j if available, adds to in-memory graph, returns GraphNode shape."""
+def _prepare_evidence(
+    body: EvidenceCreate, llm_provider: str
+) -> tuple[dict[str, Any], NodeType, dict[str, Any]]:
+    """Assign an ID if missing and build the Neo4j row and in-memory node data for one upload."""
     # Auto-generate unique ID if not provided
-    import uuid
     if not body.id:
-        body.id = f"ev-{int(datetime.utcnow().timestamp() * 1000)}-{uuid.uuid4().hex[:6]}"
-
-    # Extract LLM provider preference from header
-    llm_provider = request.headers.get("X-LLM-Provider", "default")
+        body.id = generate_evidence_id()
 
     evidence_data = {
         "id": body.id,
@@ -116,17 +212,9 @@ async def add_evidence(
         "url": body.url,
         "timestamp": body.timestamp,
     }
-    # Try Neo4j first (only if configured)
-    if session is not None:
-        try:
-            graph_queries.add_evidence(session, case_id, evidence_data)
-            logger.debug(f"Evidence saved to Neo4j: {body.id}")
-        except Exception as e:
-            logger.warning(f"Failed to save evidence to Neo4j: {e}")
 
     # Map evidence type string to NodeType
-    type_map = {"text": NodeType.REPORT, "image": NodeType.REPORT, "video": NodeType.REPORT}
-    node_type = type_map.get(body.type, NodeType.REPORT)
+    node_type = _EVIDENCE_NODE_TYPES.get(body.type, NodeType.REPORT)
 
     # Add to in-memory graph state as a GraphNode
     node_data = {
@@ -139,23 +227,64 @@ async def add_evidence(
         "role_confidence": 0.5,
         "llm_provider": llm_provider,  # NEW: Pass LLM preference to pipelines
     }
+    return evidence_data, node_type, node_data
+
+
+@router.post("/cases/{case_id}/evidence")
+async def add_evidence(
+    case_id: str,
+    body: EvidenceCreate,
+    request: Request,
+):
+    """Upload raw evidence; adds to in-memory graph, saves to Neo4j in the background if available, returns GraphNode shape."""
+    # Extract LLM provider preference from header
+    llm_provider = request.headers.get("X-LLM-Provider", "default")
+    evidence_data, node_type, node_data = _prepare_evidence(body, llm_provider)
+
+    # Persist to Neo4j (only if configured) without holding the response on the Bolt round-trip
+    if GraphDatabase.is_configured():
+        _spawn(_persist(graph_queries.add_evidence, case_id, evidence_data, "evidence"))
+
     node = create_and_add_node(node_type, case_id, node_data, node_id=body.id)
-    await broadcast_graph_update("add_node", node.model_dump(mode="json"))
+    # Serialize once: the broadcast and the response share the payload (neither mutates it)
+    payload = node.model_dump(mode="json")
+    _spawn(broadcast_graph_update("add_node", payload, case_id=case_id))
 
     # Return in GraphNode shape so frontend's mapBackendEvidence works
-    return node.model_dump(mode="json")
+    return payload
+
+
+@router.post("/cases/{case_id}/evidence/bulk")
+async def add_evidence_bulk(
+    case_id: str,
+    body: list[EvidenceCreate],
+    request: Request,
+):
+    """Bulk upload: one background Neo4j UNWIND write and one caseboard broadcast for the whole batch."""
+    llm_provider = request.headers.get("X-LLM-Provider", "default")
+    prepared = [_prepare_evidence(item, llm_provider) for item in body]
+
+    if prepared and GraphDatabase.is_configured():
+        _spawn(_persist(graph_queries.add_evidence_bulk, case_id, [p[0] for p in prepared], "bulk evidence"))
+
+    payloads = [
+        create_and_add_node(node_type, case_id, node_data, node_id=evidence_data["id"]).model_dump(mode="json")
+        for evidence_data, node_type, node_data in prepared
+    ]
+    if payloads:
+        _spawn(broadcast_graph_batch("add_nodes", case_id, payloads))
+
+    return payloads
 
 
 @router.patch("/cases/{case_id}/evidence/{evidence_id}")
 async def mark_evidence_reviewed(
     case_id: str,
     evidence_id: str,
-    body: dict[str, Any],
+    body: ReviewPatch,
     session: Neo4jSession | None = Depends(GraphDatabase.get_optional_session),
 ):
     """Mark evidence as reviewed by investigator."""
-    from app.graph_state import get_node, update_node
-
     # Update in-memory graph
     node = get_node(evidence_id)
     if not node:
@@ -165,34 +294,36 @@ async def mark_evidence_reviewed(
         raise HTTPException(status_code=400, detail="Evidence does not belong to this case")
 
     # Update reviewed status and confidence
-    reviewed = body.get("reviewed", False)
+    reviewed = body.reviewed
     update_data = {
         "reviewed": reviewed,
         "confidence": 1.0 if reviewed else node.data.get("confidence", 0.0)  # 100% when reviewed
     }
-    update_node(evidence_id, update_data)
+    node_updated = update_node(evidence_id, update_data)
 
     # Broadcast update via WebSocket
-    node_updated = get_node(evidence_id)
     if node_updated:
-        await broadcast_graph_update("update_node", node_updated.model_dump(mode="json"))
+        _spawn(broadcast_graph_update("update_node", node_updated.model_dump(mode="json"), case_id=case_id))
 
     # Optional: Persist to Neo4j if configured
-    if session is not None:
+    if session:
         try:
             # TODO: Add Neo4j update query when needed
-            logger.debug(f"Neo4j update for reviewed status: {evidence_id}")
+            logger.debug("Neo4j update for reviewed status: %s", evidence_id)
         except Exception as e:
-            logger.warning(f"Failed to update evidence in Neo4j: {e}")
+            logger.warning("Failed to update evidence in Neo4j: %s", e)
 
     return {"id": evidence_id, "reviewed": reviewed, "confidence": update_data["confidence"]}
 
 
+# (evidence_id, node version) -> inference response; LRU-evicted beyond the limit
+_INFERENCE_CACHE_SIZE = 4096
+_inference_cache: OrderedDict[tuple[str, int], dict[str, Any]] = OrderedDict()
+
+
 @router.get("/cases/{case_id}/evidence/{evidence_id}/inference")
 async def get_evidence_inference(case_id: str, evidence_id: str):
     """Get AI inference results and reasoning for an evidence node."""
-    from app.graph_state import get_node, get_edges_for_node
-
     # Get the evidence node
     node = get_node(evidence_id)
     if not node:
@@ -201,48 +332,59 @@ async def get_evidence_inference(case_id: str, evidence_id: str):
     if node.case_id != case_id:
         raise HTTPException(status_code=400, detail="Evidence does not belong to this case")
 
+    # The version changes whenever the node, its edges or a neighbour's title change,
+    # so a hit is always identical to recomputing
+    cache_key = (evidence_id, get_node_version(evidence_id))
+    cached = _inference_cache.get(cache_key)
+    if cached is not None:
+        _inference_cache.move_to_end(cache_key)
+        return cached
+
     # Get all edges connected to this evidence
     edges = get_edges_for_node(evidence_id)
 
     inferences = []
+    # Resolve every neighbour in one pass instead of a lookup per edge
+    targets = get_nodes_bulk({e.target_id if e.source_id == evidence_id else e.source_id for e in edges})
+
+    # Bind hot names to locals; the loop runs once per connected edge
+    _get_target = targets.get
+    _edge_type_value = _EDGE_TYPE_VALUE
+    _reasoning = _generate_connection_reasoning
+    inferences_append = inferences.append
+
+    # Summary statistics accumulate in the same pass: total confidence, strongest connection, type counts
+    total_confidence = 0.0
+    strongest_id = None
+    best_confidence = 0.0
+    connection_types: Counter[str] = Counter()
 
     # Build inference results for each connection
     for edge in edges:
         # Determine target node (could be source or target depending on edge direction)
-        target_id = edge.target_id if edge.source_id == evidence_id else edge.source_id
-        target_node = get_node(target_id)
+        e_src = edge.source_id
+        target_id = edge.target_id if e_src == evidence_id else e_src
+        target_node = _get_target(target_id)
 
         if not target_node:
             continue
 
         # Extract edge metadata
         edge_data = edge.data or {}
-        confidence = edge_data.get("confidence", 0.0)
-        temporal_score = edge_data.get("temporal_score", 0.0)
-        geo_score = edge_data.get("geo_score", 0.0)
-        semantic_score = edge_data.get("semantic_score", 0.0)
+        edge_get = edge_data.get
+        confidence = edge_get("confidence", 0.0)
+        temporal_score = edge_get("temporal_score", 0.0)
+        geo_score = edge_get("geo_score", 0.0)
+        semantic_score = edge_get("semantic_score", 0.0)
 
         # Generate human-readable reasoning
-        reasoning = _generate_connection_reasoning(
-            edge.edge_type.value,
-            temporal_score,
-            geo_score,
-            semantic_score,
-            edge_data
-        )
-
-        # Extract target title
-        target_data = target_node.data or {}
-        target_title = (
-            target_data.get("title") or
-            target_data.get("text_body", "")[:50] or
-            target_node.node_type.value
-        )
+        et_val = _edge_type_value[edge.edge_type]
+        reasoning = _reasoning(et_val, temporal_score, geo_score, semantic_score, edge_data)
 
-        inference = {
-            "type": edge.edge_type.value,
+        inferences_append({
+            "type": et_val,
             "target_id": target_id,
-            "target_title": target_title,
+            "target_title": target_node.display_title,
             "confidence": confidence,
             "reasoning": reasoning,
             "components": {
@@ -250,38 +392,56 @@ async def get_evidence_inference(case_id: str, evidence_id: str):
                 "geo_score": geo_score,
                 "semantic_score": semantic_score,
             },
-        }
-        inferences.append(inference)
+        })
+        total_confidence += confidence
+        # Strict > keeps the first of equally strong connections, as max() did
+        if strongest_id is None or confidence > best_confidence:
+            strongest_id, best_confidence = target_id, confidence
+        connection_types[et_val] += 1
 
     # Get AI analysis from node data
     node_data = node.data or {}
     ai_analysis = node_data.get("ai_analysis", {})
 
-    # Calculate summary statistics
     total_connections = len(inferences)
-    total_confidence = sum(inf["confidence"] for inf in inferences)
     avg_confidence = total_confidence / total_connections if total_connections > 0 else 0.0
 
-    # Find strongest connection
-    strongest = max(inferences, key=lambda x: x["confidence"]) if inferences else None
-
-    # Count connection types
-    connection_types = {}
-    for inf in inferences:
-        edge_type = inf["type"]
-        connection_types[edge_type] = connection_types.get(edge_type, 0) + 1
-
-    return {
+    result = {
         "evidence_id": evidence_id,
         "summary": {
             "total_connections": total_connections,
             "avg_confidence": avg_confidence,
-            "strongest_connection": strongest["target_id"] if strongest else None,
-            "connection_types": connection_types,
+            "strongest_connection": strongest_id,
+            "connection_types": dict(connection_types),
         },
         "inferences": inferences,
         "ai_analysis": ai_analysis,
     }
+    _inference_cache[cache_key] = result
+    if len(_inference_cache) > _INFERENCE_CACHE_SIZE:
+        _inference_cache.popitem(last=False)
+    return result
+
+
+# Score bucket tables: ascending thresholds; bisect_left counts how many a score
+# strictly exceeds, which indexes the phrase (index 0 = below every bucket).
+_REASONING_BUCKETS: tuple[tuple[str, tuple[float, ...], tuple[str | None, ...]], ...] = (
+    ("temporal", (0.3, 0.6, 0.8), (None, "similar time period", "occurred within hours", "occurred within minutes")),
+    ("geo", (0.3, 0.5, 0.8), (None, "same region", "nearby locations", "same location")),
+    ("semantic", (0.2, 0.4, 0.7), (None, "loosely related", "related content", "highly similar content")),
+)
+# Edge types whose reasoning leads with a fixed verdict sentence
+_EDGE_REASON_LEAD = {
+    "debunked_by": "Fact-check found claims in this evidence to be false. ",
+    "repost_of": "Evidence appears to be a repost of the original content. ",
+    "mutation_of": "Evidence shows signs of content manipulation or alteration. ",
+}
+# Percent labels for in-range scores, so reasoning strings skip int formatting
+_PCT = tuple(f"{i}%" for i in range(101))
+_EDGE_REASON_PREFIX = {
+    "contains": "Evidence contains related information. ",
+    "amplified_by": "Evidence amplifies the original information. ",
+}
 
 
 def _generate_connection_reasoning(
@@ -292,67 +452,55 @@ def _generate_connection_reasoning(
     edge_data: dict[str, Any],
 ) -> str:
     """Generate human-readable reasoning for why connection was made."""
+    manual = bool(edge_data.get("manual"))
+    notes = edge_data.get("notes", "") if manual else ""
+    return _connection_reasoning(edge_type, temporal_score, geo_score, semantic_score, manual, notes)
+
+
+# Keyed on the exact inputs (not bucketed scores) so cached text always matches a fresh build;
+# edges with identical scores, as seeded and pipeline-generated graphs often have, share one string.
+@lru_cache(maxsize=4096)
+def _connection_reasoning(
+    edge_type: str,
+    temporal_score: float,
+    geo_score: float,
+    semantic_score: float,
+    manual: bool,
+    notes: str,
+) -> str:
+    # Manual connections: the officer's note is the whole reasoning, so skip the score buckets.
+    # Lead types (e.g. a manual "contradicts" link, stored as debunked_by) keep their verdict sentence.
+    lead = _EDGE_REASON_LEAD.get(edge_type)
+    if manual and lead is None:
+        return f"Manually connected by officer{': ' + notes if notes else ''}"
+
     # Build detailed reasoning with component scores
     parts = []
-
-    # Temporal reasoning
-    if temporal_score > 0.8:
-        parts.append(f"occurred within minutes (temporal: {int(temporal_score*100)}%)")
-    elif temporal_score > 0.6:
-        parts.append(f"occurred within hours (temporal: {int(temporal_score*100)}%)")
-    elif temporal_score > 0.3:
-        parts.append(f"similar time period (temporal: {int(temporal_score*100)}%)")
-
-    # Geographic reasoning
-    if geo_score > 0.8:
-        parts.append(f"same location (geo: {int(geo_score*100)}%)")
-    elif geo_score > 0.5:
-        parts.append(f"nearby locations (geo: {int(geo_score*100)}%)")
-    elif geo_score > 0.3:
-        parts.append(f"same region (geo: {int(geo_score*100)}%)")
-
-    # Semantic reasoning
-    if semantic_score > 0.7:
-        parts.append(f"highly similar content (semantic: {int(semantic_score*100)}%)")
-    elif semantic_score > 0.4:
-        parts.append(f"related content (semantic: {int(semantic_score*100)}%)")
-    elif semantic_score > 0.2:
-        parts.append(f"loosely related (semantic: {int(semantic_score*100)}%)")
+    for (label, thresholds, phrases), score in zip(_REASONING_BUCKETS, (temporal_score, geo_score, semantic_score)):
+        phrase = phrases[bisect_left(thresholds, score)]
+        if phrase:
+            pct = int(score * 100)
+            parts.append(phrase + " (" + label + ": " + (_PCT[pct] if 0 <= pct <= 100 else f"{pct}%") + ")")
 
     # Edge type specific reasoning
-    if edge_type == "similar_to":
-        prefix = "Events "
-    elif edge_type == "debunked_by":
-        return "Fact-check found claims in this evidence to be false. " + ("Events " + ", ".join(parts) if parts else "")
-    elif edge_type == "contains":
-        prefix = "Evidence contains related information. "
-    elif edge_type == "repost_of":
-        return "Evidence appears to be a repost of the original content. " + ("Events " + ", ".join(parts) if parts else "")
-    elif edge_type == "mutation_of":
-        return "Evidence shows signs of content manipulation or alteration. " + ("Events " + ", ".join(parts) if parts else "")
-    elif edge_type == "amplified_by":
-        prefix = "Evidence amplifies the original information. "
-    else:
-        prefix = "Events "
-
-    # Manual connections
-    if edge_data.get("manual"):
-        notes = edge_data.get("notes", "")
-        return f"Manually connected by officer{': ' + notes if notes else ''}"
+    if lead is not None:
+        return lead + ("Events " + ", ".join(parts) if parts else "")
 
     # Combine reasoning
     if parts:
-        return prefix + ", ".join(parts)
+        return _EDGE_REASON_PREFIX.get(edge_type, "Events ") + ", ".join(parts)
 
     return "Low confidence connection - manual review recommended"
 
 
-@router.post("/cases/{case_id}/evidence/{evidence_id}/forensics")
+@router.post("/cases/{case_id}/evidence/{evidence_id}/forensics", status_code=202)
 async def analyze_forensics(case_id: str, evidence_id: str):
-    """Trigger forensic analysis on evidence with media (image or video)."""
-    from app.graph_state import get_node, update_node
-    from app.services import backboard_client, twelvelabs
-    from datetime import datetime
+    """Queue forensic analysis on evidence with media (image or video).
+
+    Returns 202 with a job_id immediately; poll GET /api/jobs/{job_id} for status.
+    Results are stored on the node and pushed to caseboard clients as update_node +
+    forensics_ready (or forensics_failed) messages.
+    """
 
     # Get the evidence node
     node = get_node(evidence_id)
@@ -367,9 +515,13 @@ async def analyze_forensics(case_id: str, evidence_id: str):
     if not media_url:
         raise HTTPException(status_code=400, detail="No media attached to this evidence")
 
+    is_image = _is_image(media_url)
+    if not is_image and not _is_video(media_url):
+        raise HTTPException(status_code=400, detail="Unsupported media type (must be image or video)")
+
     # NEW: Read LLM provider preference from node data
     llm_provider = node.data.get("llm_provider", "default")
-    logger.info(f"Forensics using LLM provider: {llm_provider}")
+    logger.info("Forensics using LLM provider: %s", llm_provider)
 
     # Build evidence context for AI analysis
     evidence_context = {
@@ -380,36 +532,73 @@ async def analyze_forensics(case_id: str, evidence_id: str):
         "timestamp": node.data.get("timestamp"),
     }
 
+    job_id = generate_job_id()
+    try:
+        await enqueue(job_id, lambda: _run_forensics(
+            case_id, evidence_id, media_url, is_image, evidence_context, llm_provider,
+        ))
+    except asyncio.QueueFull:
+        raise HTTPException(status_code=503, detail="Forensics queue is full, retry later")
+    return {"status": "pending", "job_id": job_id, "evidence_id": evidence_id}
+
+
+async def _run_forensics(
+    case_id: str,
+    evidence_id: str,
+    media_url: str,
+    is_image: bool,
+    evidence_context: dict[str, Any],
+    llm_provider: str,
+) -> None:
+    """Job body for analyze_forensics: analyse media, store results on the node, broadcast them."""
+    try:
+        await _analyze_media(case_id, evidence_id, media_url, is_image, evidence_context, llm_provider)
+    except Exception as e:
+        await broadcast_graph_update(
+            "forensics_failed",
+            {"evidence_id": evidence_id, "case_id": case_id, "error": str(e)},
+            case_id=case_id,
+        )
+        raise
+
+
+async def _analyze_media(
+    case_id: str,
+    evidence_id: str,
+    media_url: str,
+    is_image: bool,
+    evidence_context: dict[str, Any],
+    llm_provider: str,
+) -> None:
+    """Run image/video forensics, then store and broadcast the results on the evidence node."""
     # Determine media type and route to appropriate analysis
     forensic_results: dict[str, Any] = {}
     using_fallback = False
 
-    if _is_image(media_url):
-        logger.info(f"Analyzing image forensics for {evidence_id}")
-        forensic_results = await backboard_client.analyze_image_forensics(
+    # Forensics and the content description hit independent services; run them concurrently
+    if is_image:
+        logger.info("Analyzing image forensics for %s", evidence_id)
+        forensics_call = backboard_client.analyze_image_forensics(
             media_url,
             evidence_context,
             llm_provider=llm_provider
         )
-        forensic_results["media_type"] = "image"
-        # Check if fallback scores were used (ml_accuracy == 0 from fallback)
-        using_fallback = (forensic_results.get("ml_accuracy", 0) == 0.0)
-
-    elif _is_video(media_url):
-        logger.info(f"Analyzing video forensics for {evidence_id}")
-        forensic_results = await twelvelabs.detect_deepfake(media_url, evidence_context)
-        forensic_results["media_type"] = "video"
-        # TwelveLabs fallback has ml_accuracy: 0.0
-        using_fallback = (forensic_results.get("ml_accuracy", 0) == 0.0)
-
     else:
-        raise HTTPException(status_code=400, detail="Unsupported media type (must be image or video)")
+        logger.info("Analyzing video forensics for %s", evidence_id)
+        forensics_call = twelvelabs.detect_deepfake(media_url, evidence_context)
+    forensic_results, content_points = await asyncio.gather(
+        forensics_call,
+        _describe_media(media_url, is_image, evidence_context, llm_provider),
+    )
+    forensic_results["media_type"] = "image" if is_image else "video"
+    # Fallback scores (Backboard or TwelveLabs unavailable) have ml_accuracy == 0
+    using_fallback = (forensic_results.get("ml_accuracy", 0) == 0.0)
 
     # Add metadata
     forensic_results["analyzed_at"] = datetime.utcnow().isoformat()
     forensic_results["media_url"] = media_url
     forensic_results["status"] = "fallback" if using_fallback else "success"
-    forensic_results["analysis_method"] = "backboard" if _is_image(media_url) else "twelvelabs"
+    forensic_results["analysis_method"] = "backboard" if is_image else "twelvelabs"
     
     # Add 'indicators' as alias for 'manipulation_indicators' for frontend compatibility
     if "manipulation_indicators" in forensic_results and "indicators" not in forensic_results:
@@ -418,14 +607,8 @@ async def analyze_forensics(case_id: str, evidence_id: str):
     # Determine authenticity from forensic scores
     authenticity = _determine_authenticity(forensic_results)
     
-    # Extract key points from media and forensic analysis
-    key_points = await _extract_media_key_points(
-        media_url,
-        forensic_results.get("media_type", "image"),
-        forensic_results,
-        evidence_context,
-        llm_provider=llm_provider  # NEW: Pass LLM provider
-    )
+    # Combine forensic findings with the content description into key points
+    key_points = _extract_media_key_points(forensic_results, evidence_context, content_points)
     
     # Calculate confidence score (ml_accuracy as 0-1 score)
     ml_accuracy = forensic_results.get("ml_accuracy", 0.0)
@@ -442,7 +625,7 @@ async def analyze_forensics(case_id: str, evidence_id: str):
         confidence = authenticity_score / 100.0 if authenticity_score > 0 else 0.5
 
     # Store forensics, authenticity, key_points, and confidence in node data
-    update_node(evidence_id, {
+    node_updated = update_node(evidence_id, {
         "forensics": forensic_results,
         "authenticity": authenticity,
         "key_points": key_points,
@@ -450,20 +633,23 @@ async def analyze_forensics(case_id: str, evidence_id: str):
     })
 
     # Broadcast update via WebSocket
-    node_updated = get_node(evidence_id)
     if node_updated:
-        await broadcast_graph_update("update_node", node_updated.model_dump(mode="json"))
+        await broadcast_graph_update("update_node", node_updated.model_dump(mode="json"), case_id=case_id)
+
+    await broadcast_graph_update(
+        "forensics_ready",
+        {"evidence_id": evidence_id, "case_id": case_id, "forensics": forensic_results},
+        case_id=case_id,
+    )
+
+    logger.info("Forensic analysis complete for %s: %s", evidence_id, forensic_results.get("authenticity_score", "N/A"))
 
-    logger.info(f"Forensic analysis complete for {evidence_id}: {forensic_results.get('authenticity_score', 'N/A')}")
 
-    return forensic_results
 
 
 @router.get("/cases/{case_id}/evidence/{evidence_id}/forensics")
 async def get_forensic_results(case_id: str, evidence_id: str):
     """Fetch existing forensic analysis results for evidence."""
-    from app.graph_state import get_node
-
     node = get_node(evidence_id)
     if not node:
         raise HTTPException(status_code=404, detail="Evidence not found")
@@ -497,39 +683,22 @@ def _determine_authenticity(forensic_results: dict[str, Any]) -> str:
         return "unknown"
 
 
-async def _extract_media_key_points(
+async def _describe_media(
     media_url: str,
-    media_type: str,
-    forensic_results: dict[str, Any],
+    is_image: bool,
     evidence_context: dict[str, Any],
-    llm_provider: str = "default"  # NEW: LLM provider for text processing
+    llm_provider: str = "default"  # LLM provider for text processing
 ) -> list[str]:
-    """Extract key points from media based on forensic analysis and AI description."""
-    from app.services import backboard_client, twelvelabs, ai
-    
-    key_points = []
-    
-    # Add forensic findings as key points
-    indicators = forensic_results.get("manipulation_indicators", [])
-    if indicators:
-        for indicator in indicators[:3]:  # Top 3
-            if "API unavailable" not in indicator and "manual review" not in indicator:
-                key_points.append(f"Forensic finding: {indicator}")
-    
-    # Add authenticity insight
-    auth_score = forensic_results.get("authenticity_score", 0)
-    if auth_score >= 85:
-        key_points.append(f"High authenticity score ({auth_score:.1f}%)")
-    elif auth_score < 60:
-        key_points.append(f"Low authenticity score ({auth_score:.1f}%) - requires review")
-    
+    """Key points describing what the media shows (image claims or video summary sentences)."""
+    points = []
+
     # For images: Get AI description and extract claims using configured LLM
-    if media_type == "image":
+    if is_image:
         try:
             description = await backboard_client.describe_image(media_url, evidence_context)
             if description:
                 # Route claim extraction based on provider preference
-                logger.info(f"Processing image description with LLM provider: {llm_provider}")
+                logger.info("Processing image description with LLM provider: %s", llm_provider)
                 claims_result = await ai.extract_claims(
                     description,
                     llm_provider=llm_provider
@@ -540,24 +709,52 @@ async def _extract_media_key_points(
                 for claim in claims[:3]:  # Top 3 claims
                     statement = claim.get("statement", "")
                     if statement:
-                        key_points.append(f"Visual claim: {statement}")
+                        points.append(f"Visual claim: {statement}")
 
                 # If no claims extracted, fallback to raw description
                 if not claims:
-                    key_points.append(f"Visual content: {description}")
+                    points.append(f"Visual content: {description}")
         except Exception as e:
-            logger.warning(f"Failed to get image description: {e}")
-    
+            logger.warning("Failed to get image description: %s", e)
+
     # For videos: Get summary
-    elif media_type == "video":
+    else:
         try:
             summary = await twelvelabs.summarize_video(media_url)
             if summary:
                 # Split summary into key points (first 3 sentences)
                 sentences = [s.strip() for s in summary.split('. ') if s.strip()][:3]
-                key_points.extend(sentences)
+                points.extend(sentences)
         except Exception as e:
-            logger.warning(f"Failed to get video summary: {e}")
+            logger.warning("Failed to get video summary: %s", e)
+
+    return points
+
+
+def _extract_media_key_points(
+    forensic_results: dict[str, Any],
+    evidence_context: dict[str, Any],
+    content_points: list[str],
+) -> list[str]:
+    """Extract key points from forensic analysis plus the (already fetched) media description."""
+    
+    key_points = []
+    
+    # Add forensic findings as key points
+    indicators = forensic_results.get("manipulation_indicators", [])
+    if indicators:
+        for indicator in indicators[:3]:  # Top 3
+            if "API unavailable" not in indicator and "manual review" not in indicator:
+                key_points.append(f"Forensic finding: {indicator}")
+    
+    # Add authenticity insight
+    auth_score = forensic_results.get("authenticity_score", 0)
+    if auth_score >= 85:
+        key_points.append(f"High authenticity score ({auth_score:.1f}%)")
+    elif auth_score < 60:
+        key_points.append(f"Low authenticity score ({auth_score:.1f}%) - requires review")
+    
+    key_points.extend(content_points)
     
     # Add context-based insights
     if evidence_context.get("location"):
@@ -569,23 +766,24 @@ async def _extract_media_key_points(
     return key_points[:5]
 
 
+_IMAGE_EXTS = frozenset((".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff"))
+_VIDEO_EXTS = frozenset((".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm", ".mkv", ".m4v"))
+
+
 def _is_image(file_path: str) -> bool:
     """Check if file is an image based on extension."""
-    image_extensions = [".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff"]
-    return any(file_path.lower().endswith(ext) for ext in image_extensions)
+    # Only the short suffix is lowercased, not the whole URL
+    return os.path.splitext(file_path)[1].lower() in _IMAGE_EXTS
 
 
 def _is_video(file_path: str) -> bool:
     """Check if file is a video based on extension."""
-    video_extensions = [".mp4", ".avi", ".mov", ".wmv", ".flv", ".webm", ".mkv", ".m4v"]
-    return any(file_path.lower().endswith(ext) for ext in video_extensions)
+    return os.path.splitext(file_path)[1].lower() in _VIDEO_EXTS
 
 
 @router.delete("/cases/{case_id}/evidence/{evidence_id}")
 async def delete_evidence(case_id: str, evidence_id: str):
     """Delete evidence node and cascade to connected edges."""
-    from app.graph_state import get_node, delete_node
-
     # Validate evidence exists and belongs to case
     node = get_node(evidence_id)
     if not node:
@@ -602,9 +800,9 @@ async def delete_evidence(case_id: str, evidence_id: str):
         await broadcast_graph_update("delete_node", {
             "node_id": evidence_id,
             "case_id": case_id,
-        })
+        }, case_id=case_id)
 
-        logger.info(f"Deleted evidence {evidence_id} and {result['deleted_edges']} connected edges")
+        logger.info("Deleted evidence %s and %d connected edges", evidence_id, result["deleted_edges"])
 
         return {
             "status": "deleted",
@@ -615,13 +813,56 @@ async def delete_evidence(case_id: str, evidence_id: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+# Hard prompt budget for the chat evidence context (characters of serialized JSON)
+MAX_CHAT_CONTEXT_CHARS = 8000
+_CHAT_CONTENT_TRIM = 500
+# Forensics keys that repeat other fields or are bookkeeping, not evidence
+_CHAT_FORENSICS_SKIP = frozenset({"indicators", "media_url", "analyzed_at", "analysis_method"})
+
+
+def _chat_context_json(context: list[dict[str, Any]]) -> str:
+    """Serialize chat evidence context compactly, never exceeding MAX_CHAT_CONTEXT_CHARS.
+
+    Over budget, text bodies are trimmed first; evidence items that still do not fit are
+    dropped from the end, and a single item too large on its own loses its claims and forensics.
+    """
+    # to_json output is already compact (no whitespace)
+    context_str = to_json(context).decode()
+    if len(context_str) <= MAX_CHAT_CONTEXT_CHARS:
+        return context_str
+    for item in context:
+        item["content"] = (item["content"] or "")[:_CHAT_CONTENT_TRIM]
+    kept: list[str] = []
+    used = 2  # enclosing brackets
+    for item in context:
+        part = to_json(item).decode()
+        cost = len(part) + (1 if kept else 0)
+        if used + cost > MAX_CHAT_CONTEXT_CHARS:
+            break
+        kept.append(part)
+        used += cost
+    if not kept:
+        kept.append(to_json({**context[0], "claims": [], "forensics": {}}).decode())
+    # The final slice only bites on a pathological id; the budget is a hard cap
+    return f"[{','.join(kept)}]"[:MAX_CHAT_CONTEXT_CHARS]
+
+
+async def _stream_chat_events(stream, evidence_ids: list[str]):
+    """Relay Groq completion deltas as SSE: data events carry JSON-encoded text, then a done event with sources."""
+    try:
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield b"data: " + to_json(delta) + b"\n\n"
+        yield b"event: done\ndata: " + to_json({"sources": evidence_ids}) + b"\n\n"
+    except Exception as e:
+        logger.warning("GROQ chat stream failed: %s", e)
+        yield b"event: error\ndata: " + to_json({"error": "stream interrupted"}) + b"\n\n"
+
+
 @router.post("/cases/{case_id}/chat")
 async def chat_with_evidence(case_id: str, body: dict[str, Any]):
     """Chat with AI about evidence context using Groq (primary) or Backboard (fallback)."""
-    from app.graph_state import get_node
-    from app.services import backboard_client, groq
-    import json
-
     message = body.get("message", "")
     evidence_ids = body.get("evidence_ids", [])
 
@@ -630,18 +871,18 @@ async def chat_with_evidence(case_id: str, body: dict[str, Any]):
 
     # Gather evidence context
     context = []
-    for eid in evidence_ids:
-        node = get_node(eid)
-        if node and node.case_id == case_id:
+    for node in get_nodes_bulk(evidence_ids).values():
+        if node.case_id == case_id:
+            forensics = node.data.get("forensics") or {}
             context.append({
                 "id": node.id,
                 "content": node.data.get("text_body", ""),
                 "claims": node.data.get("claims", []),
-                "forensics": node.data.get("forensics", {}),
+                "forensics": {k: v for k, v in forensics.items() if k not in _CHAT_FORENSICS_SKIP},
             })
 
-    # Build prompt with evidence context
-    context_str = json.dumps(context, indent=2) if context else "No specific evidence selected."
+    # Build prompt with evidence context (minified: indentation only costs the model tokens)
+    context_str = _chat_context_json(context) if context else "No specific evidence selected."
     prompt = f"""You are an evidence analysis assistant for campus safety investigations.
 
 Evidence Context:
@@ -654,50 +895,65 @@ Provide a clear, factual response based on the evidence context. If analyzing fo
     # Primary: Try Groq
     if groq.is_available():
         try:
-            client = groq._get_client()
+            client = groq.get_async_client()
             if client:
-                response = client.chat.completions.create(
+                messages = [
+                    {"role": "system", "content": "You are an evidence analysis assistant for campus safety. Provide clear, factual answers based on evidence."},
+                    {"role": "user", "content": prompt}
+                ]
+
+                # Opt-in SSE: tokens reach the browser as they are generated
+                if body.get("stream"):
+                    stream = await client.chat.completions.create(
+                        model="llama-3.3-70b-versatile",
+                        messages=messages,
+                        temperature=0.3,
+                        max_tokens=800,
+                        stream=True,
+                    )
+                    return StreamingResponse(
+                        _stream_chat_events(stream, evidence_ids),
+                        media_type="text/event-stream",
+                    )
+
+                response = await client.chat.completions.create(
                     model="llama-3.3-70b-versatile",
-                    messages=[
-                        {"role": "system", "content": "You are an evidence analysis assistant for campus safety. Provide clear, factual answers based on evidence."},
-                        {"role": "user", "content": prompt}
-                    ],
+                    messages=messages,
                     temperature=0.3,
                     max_tokens=800,
                 )
 
                 ai_response = response.choices[0].message.content.strip()
-                logger.info(f"Chat response from GROQ: {len(ai_response)} chars")
+                logger.info("Chat response from GROQ: %d chars", len(ai_response))
 
                 return {
                     "response": ai_response,
                     "sources": evidence_ids,
                 }
         except Exception as e:
-            logger.warning(f"GROQ chat failed, trying Backboard: {e}")
+            logger.warning("GROQ chat failed, trying Backboard: %s", e)
 
     # Fallback: Try Backboard
     if backboard_client.is_available():
         try:
-            assistants = await backboard_client.get_or_create_assistants()
-            if assistants and "claim_analyst" in assistants:
-                threads = await backboard_client.create_case_thread(case_id)
-                thread_id = threads.get("claim_analyst")
-
-                if thread_id:
-                    response = await backboard_client.send_to_agent(
-                        "claim_analyst",
-                        thread_id,
-                        prompt,
-                    )
+            # create_case_thread resolves (memoized) assistants itself
+            threads = await backboard_client.create_case_thread(case_id)
+            thread_id = threads.get("claim_analyst")
+
+            if thread_id:
+                response = await backboard_client.send_to_agent(
+                    "claim_analyst",
+                    thread_id,
+                    prompt,
+                )
 
-                    if response:
-                        return {
-                            "response": response,
-                            "sources": evidence_ids,
-                        }
+                if response:
+                    return {
+                        "response": response,
+                        "sources": evidence_ids,
+                    }
         except Exception as e:
-            logger.warning(f"Backboard chat failed: {e}")
+            logger.warning("Backboard chat failed: %s", e)
 
     # Last resort: Helpful error message
     return {
@@ -706,27 +962,46 @@ Provide a clear, factual response based on the evidence context. If analyzing fo
     }
 
 
+def _check_edge_endpoints(body: EdgeCreate, case_id: str) -> None:
+    """Raise 404/400 unless both endpoints exist and belong to this case."""
+    _, _, error = get_two_nodes_in_case(body.source_id, body.target_id, case_id)
+    match error:
+        case "source_missing":
+            raise HTTPException(status_code=404, detail=f"Source evidence not found: {body.source_id}")
+        case "target_missing":
+            raise HTTPException(status_code=404, detail=f"Target evidence not found: {body.target_id}")
+        case "case_mismatch":
+            raise HTTPException(status_code=400, detail="Evidence does not belong to this case")
+
+
+def _manual_edge_type(type_str: str | None) -> EdgeType:
+    """Map a Red String link type (supports, contradicts, ...) to EdgeType."""
+    return _MANUAL_EDGE_TYPES.get((type_str or "related").lower(), EdgeType.SIMILAR_TO)
+
+
+def _add_manual_edge(case_id: str, body: EdgeCreate, edge_type: EdgeType) -> GraphEdge:
+    """Add a manual edge to the in-memory graph state."""
+    return create_and_add_edge(
+        edge_type,
+        body.source_id,
+        body.target_id,
+        case_id,
+        {
+            "note": body.note or "",
+            "manual": True,  # Mark as manually created
+            "confidence": 1.0,  # Manual connections have 100% confidence
+        }
+    )
+
+
 @router.post("/cases/{case_id}/edges")
 async def create_edge(
     case_id: str,
     body: EdgeCreate,
-    session: Neo4jSession | None = Depends(GraphDatabase.get_optional_session),
 ):
     """Red String: link two nodes. Creates RELATED edge, emits edge:created for AI analysis."""
-    from app.graph_state import get_node
-
-    # Validate that both nodes exist
-    source_node = get_node(body.source_id)
-    target_node = get_node(body.target_id)
-
-    if not source_node:
-        raise HTTPException(status_code=404, detail=f"Source evidence not found: {body.source_id}")
-    if not target_node:
-        raise HTTPException(status_code=404, detail=f"Target evidence not found: {body.target_id}")
-
-    # Validate nodes belong to this case
-    if source_node.case_id != case_id or target_node.case_id != case_id:
-        raise HTTPException(status_code=400, detail="Evidence does not belong to this case")
+    # Validate that both nodes exist and belong to this case
+    _check_edge_endpoints(body, case_id)
 
     edge_data = {
         "source_id": body.source_id,
@@ -734,68 +1009,82 @@ async def create_edge(
         "type": body.type,
         "note": body.note,
     }
-    # Try Neo4j first (only if configured)
-    if session is not None:
-        try:
-            result = graph_queries.create_link(session, case_id, edge_data)
-            logger.debug(f"Edge saved to Neo4j: {body.source_id} -> {body.target_id}")
-        except Exception as e:
-            logger.warning(f"Failed to save edge to Neo4j: {e}")
-
-    # Map edge type string to EdgeType
-    type_lower = (body.type or "related").lower()
-    edge_type_map = {
-        "supports": EdgeType.SIMILAR_TO,
-        "contradicts": EdgeType.DEBUNKED_BY,
-        "related": EdgeType.SIMILAR_TO,
-        "suspected_link": EdgeType.SIMILAR_TO,
-    }
-    edge_type = edge_type_map.get(type_lower, EdgeType.SIMILAR_TO)
+    # Persist to Neo4j (only if configured) in the background
+    if GraphDatabase.is_configured():
+        _spawn(_persist(graph_queries.create_link, case_id, edge_data, "edge"))
 
     # Add to in-memory graph state with manual flag
-    edge = create_and_add_edge(
-        edge_type,
-        body.source_id,
-        body.target_id,
-        case_id,
-        {
-            "note": body.note or "",
-            "manual": True,  # Mark as manually created
-            "confidence": 1.0,  # Manual connections have 100% confidence
-        }
-    )
-    await broadcast_graph_update("add_edge", edge.model_dump(mode="json"))
-
-    # Emit event for AI analysis trigger
-    await emit("edge:created", {
-        "case_id": case_id,
-        "source": body.source_id,
-        "target": body.target_id,
-        "relation": edge_type.value,
-    })
+    edge_type = _manual_edge_type(body.type)
+    edge = _add_manual_edge(case_id, body, edge_type)
+
+    # Serialize once: the broadcast and the response share the payload
+    payload = edge.model_dump(mode="json")
+
+    # Broadcast and emit the AI analysis trigger concurrently, after the response
+    _spawn(asyncio.gather(
+        broadcast_graph_update("add_edge", payload, case_id=case_id),
+        emit("edge:created", {
+            "case_id": case_id,
+            "source": body.source_id,
+            "target": body.target_id,
+            "relation": edge_type.value,
+        }),
+    ))
 
     # Return in GraphEdge shape so frontend's mapBackendEdge works
-    return edge.model_dump(mode="json")
+    return payload
+
+
+@router.post("/cases/{case_id}/edges/bulk")
+async def create_edges_bulk(
+    case_id: str,
+    body: list[EdgeCreate],
+):
+    """Bulk Red String: validate every link first, then one background Neo4j UNWIND write and one broadcast."""
+    for item in body:
+        _check_edge_endpoints(item, case_id)
+
+    if body and GraphDatabase.is_configured():
+        edges = [
+            {"source_id": e.source_id, "target_id": e.target_id, "type": e.type, "note": e.note}
+            for e in body
+        ]
+        _spawn(_persist(graph_queries.create_links_bulk, case_id, edges, "bulk edges"))
+
+    payloads = []
+    events = []
+    for item in body:
+        edge_type = _manual_edge_type(item.type)
+        payloads.append(_add_manual_edge(case_id, item, edge_type).model_dump(mode="json"))
+        events.append(emit("edge:created", {
+            "case_id": case_id,
+            "source": item.source_id,
+            "target": item.target_id,
+            "relation": edge_type.value,
+        }))
+    if payloads:
+        _spawn(asyncio.gather(broadcast_graph_batch("add_edges", case_id, payloads), *events))
+
+    return payloads
+
+
+# case_id -> (case version, story); only AI-generated stories are kept
+_story_cache: dict[str, tuple[int, dict[str, Any]]] = {}
 
 
 @router.get("/cases/{case_id}/story")
 async def get_case_story(case_id: str):
-    """Generate coherent narrative for the case using AI synthesis."""
-    from app.graph_state import get_nodes_for_case, get_edges_for_case
-    from app.services import ai as ai_service
-    from datetime import datetime
-
-    # Get all nodes for this case
-    nodes = get_nodes_for_case(case_id)
+    """Generate coherent narrative for the case using AI synthesis. Cached until the case changes."""
+    # Read the version before generating so a write during the LLM call isn't masked
+    version = get_case_version(case_id)
+    cached = _story_cache.get(case_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    # Report nodes, kept sorted by timestamp in graph_state as they are added
+    timeline = get_case_timeline(case_id)
     edges = get_edges_for_case(case_id)
 
-    # Filter to report nodes and sort by timestamp
-    reports = [n for n in nodes if n.node_type == NodeType.REPORT]
-    timeline = sorted(
-        reports,
-        key=lambda n: n.data.get("timestamp", datetime.now().isoformat())
-    )
-
     if not timeline:
         return {
             "case_id": case_id,
@@ -804,27 +1093,9 @@ async def get_case_story(case_id: str):
             "key_moments": [],
         }
 
-    # Prepare timeline data for AI with full context
-    timeline_data = []
-    for node in timeline:
-        timeline_data.append({
-            'timestamp': node.data.get("timestamp", "Unknown time"),
-            'data': node.data
-        })
-
-    # Prepare edge data for AI
-    edges_data = []
-    for edge in edges:
-        edges_data.append({
-            'source_id': edge.source_id,
-            'target_id': edge.target_id,
-            'edge_type': edge.edge_type,
-            'data': edge.data
-        })
-
     try:
-        # Use AI service to generate narrative
-        narrative = await ai_service.generate_case_narrative(timeline_data, edges_data, case_id)
+        # The AI service reads the nodes and edges directly when building its prompt
+        narrative = await ai.generate_case_narrative(timeline, edges, case_id)
 
         # Extract sections from narrative (simple parsing)
         sections = _parse_narrative_sections(narrative)
@@ -832,14 +1103,16 @@ async def get_case_story(case_id: str):
         # Identify key moments
         key_moments = _identify_key_moments(timeline, edges)
 
-        return {
+        story = {
             "case_id": case_id,
             "narrative": narrative,
             "sections": sections,
             "key_moments": key_moments,
         }
+        _story_cache[case_id] = (version, story)
+        return story
     except Exception as e:
-        logger.error(f"Story generation failed: {e}")
+        logger.error("Story generation failed: %s", e)
         # Fallback to simple concatenation
         fallback_narrative = f"Case involves {len(timeline)} pieces of evidence collected over time. "
         if edges:
@@ -854,46 +1127,36 @@ async def get_case_story(case_id: str):
         }
 
 
+# A header line mentions "**Origin", "**Progression", "**Current Status" / "**Status"
+# anywhere, or starts with the plain "Name:" form. One MULTILINE scan finds them all.
+_SECTION_HEADER_RE = re.compile(
+    r"^[ \t]*(?:[^\n]*?\*\*(?P<md>Origin|Progression|Current Status|Status)"
+    r"|(?P<plain>Origin|Progression|Current Status|Status):)[^\n]*",
+    re.MULTILINE,
+)
+_SECTION_KEYS = {
+    "Origin": "origin",
+    "Progression": "progression",
+    "Current Status": "current_status",
+    "Status": "current_status",
+}
+
+
 def _parse_narrative_sections(narrative: str) -> dict[str, str]:
     """Parse narrative into sections (Origin, Progression, Current Status)."""
     sections = {}
-    current_section = None
-    current_text = []
-
-    for line in narrative.split("\n"):
-        line = line.strip()
-
-        # Check for section headers (markdown or plain text)
-        if "**Origin" in line or line.startswith("Origin:"):
-            # Save previous section
-            if current_section and current_text:
-                sections[current_section] = " ".join(current_text)
-            current_section = "origin"
-            # Extract text after header if any
-            text = line.split(":", 1)[-1].strip().replace("**", "")
-            current_text = [text] if text else []
-
-        elif "**Progression" in line or line.startswith("Progression:"):
-            if current_section and current_text:
-                sections[current_section] = " ".join(current_text)
-            current_section = "progression"
-            text = line.split(":", 1)[-1].strip().replace("**", "")
-            current_text = [text] if text else []
-
-        elif "**Current Status" in line or "**Status" in line or line.startswith("Current Status:") or line.startswith("Status:"):
-            if current_section and current_text:
-                sections[current_section] = " ".join(current_text)
-            current_section = "current_status"
-            text = line.split(":", 1)[-1].strip().replace("**", "")
-            current_text = [text] if text else []
-
-        elif line and current_section:
-            # Add content to current section
-            current_text.append(line)
-
-    # Save final section
-    if current_section and current_text:
-        sections[current_section] = " ".join(current_text)
+    headers = list(_SECTION_HEADER_RE.finditer(narrative))
+
+    for i, match in enumerate(headers):
+        # Text after the header's colon, then every non-blank line up to the next header
+        header_text = match.group(0).strip().split(":", 1)[-1].strip().replace("**", "")
+        body_end = headers[i + 1].start() if i + 1 < len(headers) else len(narrative)
+        current_text = [header_text] if header_text else []
+        current_text.extend(
+            line for line in (l.strip() for l in narrative[match.end():body_end].splitlines()) if line
+        )
+        if current_text:
+            sections[_SECTION_KEYS[match.group("md") or match.group("plain")]] = " ".join(current_text)
 
     return sections
 
@@ -901,39 +1164,25 @@ def _parse_narrative_sections(narrative: str) -> dict[str, str]:
 def _identify_key_moments(timeline: list, edges: list) -> list[dict[str, str]]:
     """Identify key moments based on evidence with many connections."""
     # Find nodes with the most connections
-    connection_counts = {}
-    for edge in edges:
-        connection_counts[edge.source_id] = connection_counts.get(edge.source_id, 0) + 1
-        connection_counts[edge.target_id] = connection_counts.get(edge.target_id, 0) + 1
-
-    # Sort timeline by connection count
-    key_nodes = sorted(
-        timeline,
-        key=lambda n: connection_counts.get(n.id, 0),
-        reverse=True
-    )[:3]  # Top 3 most connected
-
-    moments = []
-    for node in key_nodes:
-        title = node.data.get("title", "Evidence")
-        description = node.data.get("text_body", "")[:100]
-        connection_count = connection_counts.get(node.id, 0)
-        moments.append({
-            "description": f"{title} - {connection_count} connections",
-            "detail": description,
-        })
+    connection_counts = Counter(chain.from_iterable((e.source_id, e.target_id) for e in edges))
 
-    return moments
+    # Top 3 most connected; nlargest keeps a 3-item heap instead of sorting the whole
+    # timeline, and matches sorted(..., reverse=True)[:3] including tie order
+    key_nodes = nlargest(3, timeline, key=lambda n: connection_counts[n.id])
+
+    return [
+        {
+            "description": f"{node.data.get('title', 'Evidence')} - {connection_counts[node.id]} connections",
+            "detail": node.data.get("text_body", "")[:100],
+        }
+        for node in key_nodes
+    ]
 
 
 @router.get("/cases/{case_id}/story/audio")
 async def get_story_audio(case_id: str):
     """Generate TTS audio for case story narrative."""
-    from fastapi.responses import Response
-    from app.services import elevenlabs
-    from app.graph_state import get_case_snapshot
-
-    # Get story
+    # Get story (served from _story_cache unless the case changed since it was generated)
     story = await get_case_story(case_id)
     if not story or not story.get('narrative'):
         raise HTTPException(status_code=404, detail="Story not available")
@@ -6,13 +6,15 @@ Files are saved temporarily and their URLs are returned for evidence creation.
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Request
-from typing import Dict, Any
+from fastapi.concurrency import run_in_threadpool
+from typing import BinaryIO, Dict, Any
+import io
 import os
 import shutil
 from pathlib import Path
 import uuid
 
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
 from app.config import settings
 
@@ -22,6 +24,15 @@ router = APIRouter(prefix="/api", tags=["files"])
 UPLOAD_DIR = Path("/tmp/wolftrace-uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Media types accepted for forensic analysis
+ALLOWED_CONTENT_TYPE_PREFIXES = ("image/", "video/", "audio/")
+
+# Chunk size for kernel-side sendfile and the buffered copy fallback
+COPY_CHUNK_SIZE = 1 << 20
+
+# Public base URL for uploaded media; settings are fixed for the process lifetime
+_MEDIA_BASE = (settings.media_base_url or "").strip().rstrip("/")
+
 
 def _safe_resolve(path: Path) -> Path:
     resolved = path.resolve()
@@ -30,11 +41,34 @@ def _safe_resolve(path: Path) -> Path:
     return resolved
 
 
+def _save_upload(src: BinaryIO, dst: Path) -> int:
+    """
+    Write an uploaded file to dst and return the number of bytes written.
+
+    Uploads that Starlette spooled to disk are copied with os.sendfile so the bytes
+    never pass through Python; small in-memory uploads use a buffered copy.
+    """
+    with dst.open("wb") as buffer:
+        # SpooledTemporaryFile keeps small uploads in a BytesIO until it rolls over
+        raw = getattr(src, "_file", src)
+        if hasattr(os, "sendfile") and not isinstance(raw, io.BytesIO):
+            try:
+                in_fd = raw.fileno()
+                start = offset = raw.tell()
+                while sent := os.sendfile(buffer.fileno(), in_fd, offset, COPY_CHUNK_SIZE):
+                    offset += sent
+                return offset - start
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                # Platform can't sendfile into a regular file; rewind the output and copy
+                buffer.seek(0)
+                buffer.truncate()
+        shutil.copyfileobj(src, buffer, COPY_CHUNK_SIZE)
+        return buffer.tell()
+
+
 def _build_public_url(request: Request, filename: str) -> str:
-    base = settings.media_base_url.strip().rstrip("/")
-    if base:
-        return f"{base}/api/upload/{filename}"
-    return str(request.base_url).rstrip("/") + f"/api/upload/{filename}"
+    base = _MEDIA_BASE or str(request.base_url).rstrip("/")
+    return f"{base}/api/upload/{filename}"
 
 
 @router.post("/upload")
@@ -50,8 +84,7 @@ async def upload_file(request: Request, file: UploadFile = File(...)) -> Dict[st
         if not file.content_type:
             raise HTTPException(status_code=400, detail="File type could not be determined")
 
-        allowed_types = ["image/", "video/", "audio/"]
-        if not any(file.content_type.startswith(t) for t in allowed_types):
+        if not file.content_type.startswith(ALLOWED_CONTENT_TYPE_PREFIXES):
             raise HTTPException(
                 status_code=400,
                 detail=f"Unsupported file type: {file.content_type}. Only images, videos, and audio files are allowed."
@@ -62,9 +95,8 @@ async def upload_file(request: Request, file: UploadFile = File(...)) -> Dict[st
         unique_filename = f"{uuid.uuid4()}{file_extension}"
         file_path = UPLOAD_DIR / unique_filename
 
-        # Save file
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save file off the event loop so a large upload doesn't stall other requests
+        size = await run_in_threadpool(_save_upload, file.file, file_path)
 
         # Return public URL for external services
         public_url = _build_public_url(request, unique_filename)
@@ -74,22 +106,31 @@ async def upload_file(request: Request, file: UploadFile = File(...)) -> Dict[st
             "file_url": public_url,
             "filename": file.filename or unique_filename,
             "content_type": file.content_type,
-            "size": file_path.stat().st_size
+            "size": size
         }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"File upload failed: {str(e)}")
 
 
-@router.get("/upload/{filename}")
-async def get_file(filename: str) -> FileResponse:
+@router.get("/upload/{filename}", response_model=None)
+async def get_file(request: Request, filename: str) -> FileResponse | Response:
     """
     Serve an uploaded file over HTTP.
+
+    Honors If-None-Match with a 304 so repeat fetches of the same media skip the body.
     """
     file_path = _safe_resolve(UPLOAD_DIR / filename)
-    if not file_path.exists():
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="File not found")
-    return FileResponse(str(file_path))
+    etag = f'W/"{st.st_size:x}-{st.st_mtime_ns:x}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(","))):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(str(file_path), headers=headers, stat_result=st)
 
 
 @router.delete("/upload/{filename}")
@@ -0,0 +1,15 @@
+"""Jobs router: GET /api/jobs/{job_id} to poll background job status."""
+from fastapi import APIRouter, HTTPException
+
+from app.job_queue import get_job_status
+
+router = APIRouter(prefix="/api", tags=["jobs"])
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status of a queued job: pending, running, done or failed."""
+    status = get_job_status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job_id": job_id, "status": status}
@@ -1,5 +1,6 @@
 """Reports router: POST /api/report (public), GET /api/reports (officer)."""
 from datetime import datetime
+from functools import lru_cache
 
 from fastapi import APIRouter
 
@@ -61,32 +62,42 @@ async def submit_report(body: ReportCreate):
     )
 
 
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime | None:
+    """Parse a stored ISO timestamp; None if malformed. Reports are re-listed unchanged, so results are cached."""
+    try:
+        # Python 3.11+ accepts a trailing "Z" directly
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 @router.get("/reports", response_model=list[ReportOut])
 async def list_reports():
-    """Officer-only: list all reports."""
+    """Officer-only: list all reports.
+
+    Rows come from in-memory state that submit_report and the seeder already validated,
+    so models are built with model_construct; the response_model still checks the output.
+    """
     out = []
     for r in get_all_reports():
         loc = r.get("location")
         if loc and isinstance(loc, dict):
-            try:
-                loc = Location(**{k: v for k, v in loc.items() if k in ("lat", "lng", "building")})
-            except Exception:
-                loc = None
+            lat, lng = loc.get("lat"), loc.get("lng")
+            if isinstance(lat, (int, float)) and isinstance(lng, (int, float)):
+                loc = Location.model_construct(lat=lat, lng=lng, building=loc.get("building"))
+            else:
+                # Seeded cases only carry a building name; anything else goes through validation
+                try:
+                    loc = Location(**{k: v for k, v in loc.items() if k in ("lat", "lng", "building")})
+                except Exception:
+                    loc = None
         ts = r.get("timestamp")
         if isinstance(ts, str):
-            try:
-                ts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            except Exception:
-                ts = None
+            ts = _parse_timestamp(ts)
         created = r.get("created_at")
-        if isinstance(created, str):
-            try:
-                created = datetime.fromisoformat(created.replace("Z", "+00:00"))
-            except Exception:
-                created = datetime.utcnow()
-        else:
-            created = datetime.utcnow()
-        out.append(ReportOut(
+        created = (_parse_timestamp(created) if isinstance(created, str) else None) or datetime.utcnow()
+        out.append(ReportOut.model_construct(
             case_id=r.get("case_id", ""),
             report_id=r.get("report_id", ""),
             text_body=r.get("text_body", ""),
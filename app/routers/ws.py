@@ -1,26 +1,50 @@
 """WebSocket router: /ws/caseboard, /ws/alerts."""
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, WebSocket
+from pydantic_core import to_json
 
-from app.graph_state import connection_manager, get_all_snapshots
+from app.graph_state import connection_manager, get_all_snapshots, get_case_snapshot, get_version
 
 router = APIRouter(tags=["ws"])
 
+_MAX_SNAPSHOT_FRAMES = 256
+# case_id (None = all cases) -> (graph version, encoded snapshots frame). A reconnect
+# storm against an unchanged graph builds and encodes the frame once.
+_snapshot_frames: dict[str | None, tuple[int, str]] = {}
+
+
+def _snapshots_frame(case_id: str | None) -> str:
+    version = get_version()
+    cached = _snapshot_frames.get(case_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    if case_id:
+        snapshot = get_case_snapshot(case_id)
+        snapshots = [snapshot] if snapshot else []
+    else:
+        snapshots = get_all_snapshots()
+    # Snapshots can be large; encode with pydantic-core rather than stdlib json
+    frame = to_json({"type": "snapshots", "payload": snapshots}).decode()
+    if cached is None and len(_snapshot_frames) >= _MAX_SNAPSHOT_FRAMES:
+        _snapshot_frames.clear()
+    _snapshot_frames[case_id] = (version, frame)
+    return frame
+
 
 @router.websocket("/ws/caseboard")
-async def ws_caseboard(websocket: WebSocket):
-    """Caseboard WS: on connect send all snapshots; then stream graph_update messages."""
+async def ws_caseboard(websocket: WebSocket, case_id: str | None = None):
+    """Caseboard WS: on connect send snapshots; then stream graph_update messages.
+
+    With ?case_id=... the socket joins that case's room and only receives its snapshot and updates.
+    """
     await websocket.accept()
-    await connection_manager.connect_caseboard(websocket)
+    await connection_manager.connect_caseboard(websocket, case_id)
     try:
-        snapshots = get_all_snapshots()
-        await websocket.send_json({"type": "snapshots", "payload": snapshots})
-        while True:
-            try:
-                _ = await websocket.receive_text()
-            except WebSocketDisconnect:
-                break
+        await websocket.send_text(_snapshots_frame(case_id))
+        # Inbound frames carry nothing we act on; wait for the disconnect without decoding them
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     finally:
-        await connection_manager.disconnect_caseboard(websocket)
+        await connection_manager.disconnect_caseboard(websocket, case_id)
 
 
 @router.websocket("/ws/alerts")
@@ -29,10 +53,8 @@ async def ws_alerts(websocket: WebSocket):
     await websocket.accept()
     await connection_manager.connect_alert(websocket)
     try:
-        while True:
-            try:
-                _ = await websocket.receive_text()
-            except WebSocketDisconnect:
-                break
+        # Inbound frames carry nothing we act on; wait for the disconnect without decoding them
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
     finally:
         await connection_manager.disconnect_alert(websocket)
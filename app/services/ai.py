@@ -1,12 +1,25 @@
 """Unified AI layer: routes to GROQ, Backboard, or Gemini based on preference."""
+import asyncio
 import json
 import logging
 from typing import Any
 
-from app.services import backboard_client, gemini, groq
+from pydantic_core import from_json, to_json
+
+from app.models.graph import GraphEdge, GraphNode
+from app.services import backboard_client, gemini, groq, llm_cache
 
 logger = logging.getLogger(__name__)
 
+# Groq responses keyed by a hash of their prompt: repeated tips, alert drafts and story
+# loads of an unchanged case skip the LLM call, and concurrent misses for the same prompt
+# share one call. Only the Groq path is cached: the Backboard fallbacks post to the
+# case's own agent threads, which later agents read, so they must run for every case.
+# Mock fallbacks are never cached.
+_claims_cache = llm_cache.ResponseCache(maxsize=1000, ttl=600)
+_alert_cache = llm_cache.ResponseCache(maxsize=256, ttl=600)
+_narrative_cache = llm_cache.ResponseCache(maxsize=256, ttl=1800)
+
 
 async def extract_claims(
     report_text: str,
@@ -27,7 +40,7 @@ async def extract_claims(
     if groq.is_available():
         try:
             logger.info("Routing extract_claims to GROQ")
-            return await groq.extract_claims(report_text)
+            return await _groq_extract_claims(report_text)
         except Exception as e:
             logger.warning(f"GROQ failed, falling back to Backboard: {e}")
             # Fall through to Backboard
@@ -35,10 +48,12 @@ async def extract_claims(
     # Fallback 1: Use Backboard (uses their Gemini key)
     if backboard_client.is_available():
         try:
-            threads = await backboard_client.create_case_thread(case_id)
+            threads, past = await asyncio.gather(
+                backboard_client.create_case_thread(case_id),
+                backboard_client.recall_memory("claim_analyst", report_text[:100]),
+            )
             tid = threads.get("claim_analyst", "")
             if tid:
-                past = await backboard_client.recall_memory("claim_analyst", report_text[:100])
                 ctx = f"Past similar cases:\n{past}\n\n" if past else ""
                 msg = f"{ctx}Analyze this report:\n\n{report_text}\n\nLocation: {location}\nTimestamp: {timestamp}"
                 resp = await backboard_client.send_to_agent("claim_analyst", tid, msg)
@@ -49,12 +64,24 @@ async def extract_claims(
 
     # Fallback 2: Return mock data (NO direct Gemini usage)
     logger.warning("Both GROQ and Backboard unavailable, returning mock claims")
-    return {
-        "claims": [{"statement": report_text[:200] or "Unknown claim", "confidence": 0.5, "category": "other"}],
-        "urgency": 0.5,
-        "misinformation_flags": [],
-        "suggested_verifications": ["Verify with on-site sources"],
-    }
+    return groq.mock_claims(report_text)
+
+
+async def _groq_extract_claims(report_text: str) -> dict[str, Any]:
+    """groq.extract_claims behind the response cache.
+
+    Results are stored as JSON, so every hit decodes a fresh dict that callers can
+    store in node data without aliasing each other.
+    """
+
+    async def load() -> bytes:
+        return to_json(await groq.extract_claims(report_text))
+
+    def keep(payload: bytes) -> bool:
+        # Only evaluated after a miss; groq returns mock claims instead of raising
+        return payload not in (to_json(groq.mock_claims(report_text)), to_json(groq.mock_claims("")))
+
+    return from_json(await llm_cache.cached(_claims_cache, llm_cache.prompt_key(report_text), load, keep))
 
 
 async def fact_check_claims(claims: list[dict], case_id: str, thread_ids: dict[str, str]) -> dict[str, Any]:
@@ -65,7 +92,7 @@ async def fact_check_claims(claims: list[dict], case_id: str, thread_ids: dict[s
     if not tid:
         return {}
     try:
-        claims_str = json.dumps(claims, indent=2)
+        claims_str = json.dumps(claims, separators=(",", ":"))
         msg = f"Fact-check the following claims from the Claim Analyst:\n\n{claims_str}"
         resp = await backboard_client.send_to_agent("fact_checker", tid, msg)
         return _parse_claims_json(resp) if resp else {}
@@ -86,7 +113,12 @@ async def compose_alert(
     if groq.is_available():
         try:
             logger.info("Routing compose_alert to GROQ")
-            return await groq.compose_alert(case_context, officer_notes)
+            return await llm_cache.cached(
+                _alert_cache,
+                llm_cache.prompt_key(case_context, officer_notes or ""),
+                lambda: groq.compose_alert(case_context, officer_notes),
+                keep=lambda alert: alert != groq.mock_alert_draft(),
+            )
         except Exception as e:
             logger.warning(f"GROQ failed, falling back to Backboard: {e}")
 
@@ -114,7 +146,7 @@ async def compose_alert(
 
     # Fallback 2: Mock alert (NO direct Gemini usage)
     logger.warning("Both GROQ and Backboard unavailable, returning mock alert")
-    return "Campus Safety Notice: We are investigating a reported incident. Please avoid the area until further notice. Check official channels for updates."
+    return groq.mock_alert_draft()
 
 
 async def synthesize_case(case_id: str, thread_ids: dict[str, str], case_context: str = "") -> dict[str, Any]:
@@ -136,15 +168,15 @@ async def synthesize_case(case_id: str, thread_ids: dict[str, str], case_context
 
 
 async def generate_case_narrative(
-    timeline: list[dict[str, Any]],
-    connections: list[dict[str, Any]],
+    timeline: list[GraphNode],
+    connections: list[GraphEdge],
     case_id: str = ""
 ) -> str:
     """Generate case narrative using GROQ (default) or Backboard fallback.
 
     Args:
-        timeline: List of evidence nodes sorted by timestamp
-        connections: List of edges connecting evidence
+        timeline: Evidence nodes sorted by timestamp (read in place, not copied)
+        connections: Edges connecting evidence
         case_id: Case identifier for Backboard fallback
 
     Returns:
@@ -153,9 +185,9 @@ async def generate_case_narrative(
 
     # Build rich timeline context
     timeline_context = []
-    for item in timeline:
-        data = item.get('data', {})
-        entry = f"- {item.get('timestamp', 'Unknown')}"
+    for node in timeline:
+        data = node.data
+        entry = f"- {data.get('timestamp', 'Unknown time')}"
 
         # Add title/content
         title = data.get('title') or data.get('text_body', '')[:100]
@@ -181,12 +213,12 @@ async def generate_case_narrative(
     # Build connection context with confidence
     connection_context = []
     for conn in connections[:20]:
-        edge_type = conn.get('edge_type', 'related')
+        edge_type = conn.edge_type
         if hasattr(edge_type, 'value'):
             edge_type = edge_type.value
-        confidence = conn.get('data', {}).get('confidence', 0)
-        source = conn.get('source_id', 'unknown')
-        target = conn.get('target_id', 'unknown')
+        confidence = conn.data.get('confidence', 0)
+        source = conn.source_id
+        target = conn.target_id
 
         conn_str = f"- {source} → {edge_type} → {target}"
         if confidence > 0:
@@ -216,7 +248,12 @@ Keep narrative factual, concise, and focused on evidence. Use confidence scores
     if groq.is_available():
         try:
             logger.info("Routing generate_case_narrative to GROQ")
-            return await groq.generate_narrative(prompt)
+            return await llm_cache.cached(
+                _narrative_cache,
+                llm_cache.prompt_key(prompt),
+                lambda: groq.generate_narrative(prompt),
+                keep=lambda n: n not in (groq.NARRATIVE_UNAVAILABLE, groq.NARRATIVE_FAILED),
+            )
         except Exception as e:
             logger.warning(f"GROQ failed, falling back to Backboard: {e}")
 
@@ -238,8 +275,15 @@ Keep narrative factual, concise, and focused on evidence. Use confidence scores
 
 
 async def generate_search_queries(claims: list[dict[str, Any]], llm_provider: str = "groq") -> list[str]:
-    """Generate search queries using GROQ (default) with mock fallback."""
+    """Generate search queries using GROQ (default) with mock fallback.
+
+    Concurrent calls for the same claims share one request.
+    """
+    key = llm_cache.prompt_key("search_queries", json.dumps(claims, sort_keys=True, separators=(",", ":")))
+    return await llm_cache.single_flight(key, lambda: _generate_search_queries_uncached(claims))
+
 
+async def _generate_search_queries_uncached(claims: list[dict[str, Any]]) -> list[str]:
     # Primary: Use GROQ
     if groq.is_available():
         try:
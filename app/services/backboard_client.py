@@ -1,11 +1,16 @@
 """Backboard.io client — 4 specialized AI agents with persistent case threads."""
+import asyncio
+import inspect
 import json
 import logging
 import re
+import time
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+import httpx
+
 from app.config import settings
 
 UPLOAD_DIR = Path("/tmp/wolftrace-uploads")
@@ -13,8 +18,16 @@ UPLOAD_DIR = Path("/tmp/wolftrace-uploads")
 logger = logging.getLogger(__name__)
 
 _client = None
+_http_client = None
 _assistants: dict[str, Any] = {}
 _case_threads: dict[str, dict[str, str]] = {}  # case_id -> {assistant_name: thread_id}
+# Single-flight locks so concurrent first calls don't create duplicate assistants/threads
+_assistants_lock = asyncio.Lock()
+_thread_locks: dict[str, asyncio.Lock] = {}  # only while a case's threads are being created
+# After a failed lookup, skip the upstream round-trip until this monotonic time
+FAILURE_TTL_SECONDS = 60.0
+_assistants_retry_at = 0.0
+_threads_retry_at: dict[str, float] = {}  # case_id -> retry time after a failed thread creation
 _UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
 
 CLAIM_ANALYST_INSTRUCTIONS = """You are the Claim Analyst for Shadow Bureau, a campus safety intelligence system.
@@ -77,7 +90,10 @@ def _get_client():
         try:
             from backboard import BackboardClient
 
-            _client = BackboardClient(api_key=settings.backboard_api_key)
+            if "http_client" in inspect.signature(BackboardClient).parameters:
+                _client = BackboardClient(api_key=settings.backboard_api_key, http_client=_get_http_client())
+            else:
+                _client = BackboardClient(api_key=settings.backboard_api_key)
         except ImportError as e:
             logger.warning("Backboard SDK not installed: %s", e)
         except Exception as e:
@@ -85,62 +101,114 @@ def _get_client():
     return _client
 
 
+def _get_http_client():
+    """Pooled keep-alive transport shared by every Backboard call, so agent round-trips skip the TLS handshake."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=90),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+    return _http_client
+
+
+async def close_client() -> None:
+    """Close the shared connection pool. Call on application shutdown."""
+    global _client, _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+        _client = None
+
+
 def is_available() -> bool:
     return bool(_get_client() and settings.backboard_api_key)
 
 
 async def get_or_create_assistants() -> dict[str, Any]:
-    """Create the 4 investigation agents. Called once at startup."""
-    global _assistants
+    """Create the 4 investigation agents. Called once at startup; memoized afterwards."""
+    global _assistants, _assistants_retry_at
+    if _assistants:
+        return _assistants
     client = _get_client()
-    if not client:
+    if not client or time.monotonic() < _assistants_retry_at:
         return {}
-    try:
+    async with _assistants_lock:
         if _assistants:
             return _assistants
-        existing = await client.list_assistants(limit=100)
-        by_name = {a.name: a for a in existing if hasattr(a, "name")}
-        for name, instructions in [
-            ("Shadow Bureau — Claim Analyst", CLAIM_ANALYST_INSTRUCTIONS),
-            ("Shadow Bureau — Fact Checker", FACT_CHECKER_INSTRUCTIONS),
-            ("Shadow Bureau — Alert Composer", ALERT_COMPOSER_INSTRUCTIONS),
-            ("Shadow Bureau — Case Synthesizer", CASE_SYNTHESIZER_INSTRUCTIONS),
-        ]:
-            key = name.split("—")[-1].strip().lower().replace(" ", "_")
-            if name in by_name:
-                _assistants[key] = by_name[name]
-            else:
-                a = await client.create_assistant(name=name, description=instructions)
-                _assistants[key] = a
-        return _assistants
-    except Exception as e:
-        logger.exception("get_or_create_assistants failed: %s", e)
-        return {}
+        try:
+            existing = await client.list_assistants(limit=100)
+            by_name = {a.name: a for a in existing if hasattr(a, "name")}
+            specs = [
+                (name.split("—")[-1].strip().lower().replace(" ", "_"), name, instructions)
+                for name, instructions in [
+                    ("Shadow Bureau — Claim Analyst", CLAIM_ANALYST_INSTRUCTIONS),
+                    ("Shadow Bureau — Fact Checker", FACT_CHECKER_INSTRUCTIONS),
+                    ("Shadow Bureau — Alert Composer", ALERT_COMPOSER_INSTRUCTIONS),
+                    ("Shadow Bureau — Case Synthesizer", CASE_SYNTHESIZER_INSTRUCTIONS),
+                ]
+            ]
+            # Create the missing assistants concurrently rather than one round-trip at a time
+            missing = [(key, name, instructions) for key, name, instructions in specs if name not in by_name]
+            created = await asyncio.gather(
+                *(client.create_assistant(name=name, description=instructions) for _, name, instructions in missing)
+            )
+            made = dict(zip((key for key, _, _ in missing), created))
+            _assistants = {key: by_name[name] if name in by_name else made[key] for key, name, _ in specs}
+            return _assistants
+        except Exception as e:
+            logger.exception("get_or_create_assistants failed: %s", e)
+            _assistants_retry_at = time.monotonic() + FAILURE_TTL_SECONDS
+            return {}
 
 
 async def create_case_thread(case_id: str) -> dict[str, str]:
-    """Create persistent Backboard threads for a case (one per assistant)."""
-    global _case_threads
-    if case_id in _case_threads:
-        return _case_threads[case_id]
+    """Create persistent Backboard threads for a case (one per assistant). Memoized per case."""
+    threads = _case_threads.get(case_id)
+    if threads:
+        return threads
+    if time.monotonic() < _threads_retry_at.get(case_id, 0.0):
+        return {}
+    lock = _thread_locks.setdefault(case_id, asyncio.Lock())
+    try:
+        async with lock:
+            if case_id in _case_threads:
+                return _case_threads[case_id]
+            if time.monotonic() < _threads_retry_at.get(case_id, 0.0):
+                return {}
+            return await _create_case_threads(case_id)
+    finally:
+        # Drop the lock once nobody holds it so the map doesn't grow with every case seen
+        if not lock.locked() and _thread_locks.get(case_id) is lock:
+            del _thread_locks[case_id]
+
+
+async def _create_case_threads(case_id: str) -> dict[str, str]:
     client = _get_client()
     assistants = await get_or_create_assistants()
     if not client or not assistants:
         return {}
-    threads = {}
+    aids = {
+        key: aid
+        for key, assistant in assistants.items()
+        if (aid := getattr(assistant, "assistant_id", None) or getattr(assistant, "id", None) or assistant)
+    }
     try:
-        for key, assistant in assistants.items():
-            aid = getattr(assistant, "assistant_id", None) or getattr(assistant, "id", None) or assistant
-            if aid:
-                t = await client.create_thread(assistant_id=aid)
-                tid = _extract_thread_id(t)
-                if tid:
-                    threads[key] = tid
-        _case_threads[case_id] = threads
-        return threads
+        created = await asyncio.gather(*(client.create_thread(assistant_id=aid) for aid in aids.values()))
+        threads = {key: tid for key, t in zip(aids, created) if (tid := _extract_thread_id(t))}
     except Exception as e:
         logger.warning("create_case_thread failed: %s", e)
-        return {}
+        threads = {}
+    if threads:
+        _case_threads[case_id] = threads
+        _threads_retry_at.pop(case_id, None)
+    else:
+        now = time.monotonic()
+        # Forget expired backoffs so the map only holds cases still waiting to retry
+        for cid in [c for c, t in _threads_retry_at.items() if t <= now]:
+            del _threads_retry_at[cid]
+        _threads_retry_at[case_id] = now + FAILURE_TTL_SECONDS
+    return threads
 
 
 async def send_to_agent(
@@ -74,7 +74,7 @@ async def generate_search_queries(claims: list[dict[str, Any]]) -> list[str]:
     if not client:
         return _mock_search_queries()
     try:
-        claims_str = json.dumps(claims, indent=2)
+        claims_str = json.dumps(claims, separators=(",", ":"))
         response = await _generate_content(client, f"{NETWORK_CRAWLER_PROMPT}\n\nClaims:\n{claims_str}")
         if response:
             return _parse_search_queries(response)
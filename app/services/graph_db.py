@@ -1,9 +1,10 @@
 """Neo4j AuraDB connection — singleton driver with FastAPI dependency."""
 import logging
-from typing import Generator
+from typing import AsyncGenerator
 
-from neo4j import GraphDatabase as Neo4j
-from neo4j import Session as Neo4jSession
+from neo4j import READ_ACCESS, WRITE_ACCESS
+from neo4j import AsyncGraphDatabase as Neo4j
+from neo4j import AsyncSession as Neo4jSession
 
 from app.config import settings
 
@@ -15,13 +16,21 @@ _instance: "GraphDatabase | None" = None
 class GraphDatabase:
     """Singleton Neo4j driver for AuraDB. Connect on startup, close on shutdown."""
 
+    # Set once when the singleton is built; lets optional dependencies bail out
+    # without touching the driver when Neo4j is not configured.
+    _configured: bool = False
+
     def __init__(self) -> None:
         self._driver = None
         if settings.neo4j_uri and settings.neo4j_username and settings.neo4j_password:
             self._driver = Neo4j.driver(
                 settings.neo4j_uri,
                 auth=(settings.neo4j_username, settings.neo4j_password),
+                max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+                connection_acquisition_timeout=settings.neo4j_connection_acquisition_timeout,
+                max_connection_lifetime=settings.neo4j_max_connection_lifetime,
             )
+            GraphDatabase._configured = True
             logger.info("Neo4j driver initialized for %s", settings.neo4j_uri)
         else:
             logger.warning(
@@ -32,6 +41,21 @@ class GraphDatabase:
     def driver(self):
         return self._driver
 
+    def session(self, access_mode: str = WRITE_ACCESS) -> Neo4jSession:
+        """Open an async session on the configured database (server default if unset).
+
+        READ_ACCESS lets a cluster route the session to a read replica.
+        """
+        return self._driver.session(
+            database=settings.neo4j_database or None,
+            default_access_mode=access_mode,
+        )
+
+    @classmethod
+    def is_configured(cls) -> bool:
+        """True if Neo4j credentials were present when the driver was created."""
+        return cls._configured
+
     @classmethod
     def get_instance(cls) -> "GraphDatabase":
         """Return the singleton instance."""
@@ -40,50 +64,59 @@ class GraphDatabase:
             _instance = cls()
         return _instance
 
-    def verify_connection(self) -> bool:
+    async def verify_connection(self) -> bool:
         """Run a simple query to verify the connection. Returns True if OK."""
         if not self._driver:
             return False
         try:
-            with self._driver.session() as session:
-                result = session.run("RETURN 1 AS n")
-                record = result.single()
+            async with self.session() as session:
+                result = await session.run("RETURN 1 AS n")
+                record = await result.single()
                 return record is not None and record["n"] == 1
         except Exception as e:
             logger.exception("Neo4j connection verify failed: %s", e)
             return False
 
     @classmethod
-    def get_session(cls) -> Generator[Neo4jSession, None, None]:
+    async def get_session(cls) -> AsyncGenerator[Neo4jSession, None]:
         """FastAPI dependency: yields a Neo4j session, closes when done."""
         db = cls.get_instance()
         if not db._driver:
             raise RuntimeError("Neo4j driver not initialized")
-        with db._driver.session() as session:
+        async with db.session() as session:
             yield session
 
     @classmethod
-    def get_optional_session(cls) -> Generator[Neo4jSession | None, None, None]:
+    async def get_read_session(cls) -> AsyncGenerator[Neo4jSession, None]:
+        """FastAPI dependency: like get_session, but for read-only endpoints."""
+        db = cls.get_instance()
+        if not db._driver:
+            raise RuntimeError("Neo4j driver not initialized")
+        async with db.session(READ_ACCESS) as session:
+            yield session
+
+    @classmethod
+    async def get_optional_session(cls) -> AsyncGenerator[Neo4jSession | None, None]:
         """
         FastAPI dependency: yields Neo4j session if available, None otherwise.
         Use this for endpoints where Neo4j is optional.
         """
-        db = cls.get_instance()
-        if not db._driver:
-            logger.debug("Neo4j not configured, yielding None")
+        if not cls._configured:
             yield None
             return
 
+        db = cls.get_instance()
         try:
-            with db._driver.session() as session:
+            async with db.session() as session:
                 yield session
         except Exception as e:
             logger.warning(f"Neo4j session failed: {e}")
             yield None
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Shut down the driver. Call on application shutdown."""
         if self._driver:
-            self._driver.close()
+            await self._driver.close()
             self._driver = None
+            GraphDatabase._configured = False
             logger.info("Neo4j driver closed")
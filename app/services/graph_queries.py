@@ -1,14 +1,96 @@
 """Cypher query repository for Neo4j Case and Evidence."""
 import logging
 import math
-from typing import Any
+from typing import Any, AsyncIterator
 
-from neo4j import Session as Neo4jSession
+from neo4j import AsyncManagedTransaction, AsyncSession as Neo4jSession
+from pydantic_core import to_json
 
 logger = logging.getLogger(__name__)
 
+# Cypher is kept in module constants and every value goes through $parameters,
+# so the query text is identical on each call and Neo4j reuses the cached plan.
+_CREATE_CASE_QUERY = """
+MERGE (c:Case {id: $case_id})
+SET c.title = $title, c.description = $description, c.created_at = datetime()
+RETURN c
+"""
 
-def create_case(
+_ADD_EVIDENCE_QUERY = """
+MATCH (c:Case {id: $case_id})
+CREATE (e:Evidence:Node {
+    id: $id,
+    type: $type,
+    content: $content,
+    url: $url,
+    timestamp: $timestamp
+})
+CREATE (c)-[:CONTAINS]->(e)
+RETURN e
+"""
+
+_ADD_EVIDENCE_BULK_QUERY = """
+MATCH (c:Case {id: $case_id})
+UNWIND $rows AS r
+MERGE (e:Evidence:Node {id: r.id})
+SET e.type = r.type, e.content = r.content, e.url = r.url, e.timestamp = r.timestamp
+MERGE (c)-[:CONTAINS]->(e)
+RETURN count(e) AS n
+"""
+
+# Both endpoints must hang off the same Case, so existence and case membership are
+# checked in the same statement (and transaction) that writes the edge
+_CREATE_LINK_QUERY = """
+MATCH (c:Case {id: $case_id})
+MATCH (c)-[:CONTAINS]->(a:Node {id: $source_id})
+MATCH (c)-[:CONTAINS]->(b:Node {id: $target_id})
+MERGE (a)-[r:RELATED {type: $type}]->(b)
+SET r.created_at = datetime(), r.note = $note, r.manual = true
+RETURN a, b, r
+"""
+
+# Each endpoint is matched separately by id so no cross-row Cartesian product is built
+_CREATE_LINKS_BULK_QUERY = """
+MATCH (c:Case {id: $case_id})
+UNWIND $pairs AS p
+MATCH (c)-[:CONTAINS]->(a:Node {id: p.source_id})
+MATCH (c)-[:CONTAINS]->(b:Node {id: p.target_id})
+MERGE (a)-[r:RELATED {type: p.type}]->(b)
+SET r.created_at = datetime(), r.note = p.note, r.manual = true
+RETURN count(r) AS n
+"""
+
+# Contained nodes plus Inference nodes attached to them (same set the old collect() query merged)
+_CASE_NODES_QUERY = """
+MATCH (:Case {id: $case_id})-[:CONTAINS]->(n)
+RETURN n
+UNION
+MATCH (c:Case {id: $case_id})-[:CONTAINS]->()-[]-(n:Inference)
+RETURN n
+"""
+
+_CASE_EDGES_QUERY = """
+MATCH (c:Case {id: $case_id})-[:CONTAINS]->(n)-[r]-(m)
+WHERE (c)-[:CONTAINS]->(m) OR m:Inference
+RETURN DISTINCT r
+"""
+
+_COUNT_CASE_NODES_QUERY = f"CALL {{{_CASE_NODES_QUERY}}} RETURN count(n) AS n"
+
+
+async def _single(tx: AsyncManagedTransaction, query: str, **params: Any):
+    """Transaction function: run one query and return its single record (or None)."""
+    result = await tx.run(query, **params)
+    return await result.single()
+
+
+async def _values(tx: AsyncManagedTransaction, query: str, key: str, **params: Any) -> list[Any]:
+    """Transaction function: run one query and return `key` from every record."""
+    result = await tx.run(query, **params)
+    return [record[key] async for record in result]
+
+
+async def create_case(
     session: Neo4jSession,
     case_id: str,
     title: str = "",
@@ -18,19 +100,14 @@ def create_case(
     Create or update a Case node in Neo4j.
     MERGE ensures idempotency; SET updates title, description, created_at.
     """
-    query = """
-    MERGE (c:Case {id: $case_id})
-    SET c.title = $title, c.description = $description, c.created_at = datetime()
-    RETURN c
-    """
     try:
-        result = session.run(
-            query,
+        record = await session.execute_write(
+            _single,
+            _CREATE_CASE_QUERY,
             case_id=case_id,
             title=title or "",
             description=description or "",
         )
-        record = result.single()
         if record and record["c"]:
             node = record["c"]
             return {
@@ -44,7 +121,7 @@ def create_case(
     return None
 
 
-def add_evidence(
+async def add_evidence(
     session: Neo4jSession,
     case_id: str,
     evidence_data: dict[str, Any],
@@ -65,21 +142,10 @@ def add_evidence(
         logger.warning("add_evidence: missing id in evidence_data")
         return None
 
-    query = """
-    MATCH (c:Case {id: $case_id})
-    CREATE (e:Evidence:Node {
-        id: $id,
-        type: $type,
-        content: $content,
-        url: $url,
-        timestamp: $timestamp
-    })
-    CREATE (c)-[:CONTAINS]->(e)
-    RETURN e
-    """
     try:
-        result = session.run(
-            query,
+        record = await session.execute_write(
+            _single,
+            _ADD_EVIDENCE_QUERY,
             case_id=case_id,
             id=eid,
             type=etype,
@@ -87,7 +153,6 @@ def add_evidence(
             url=url or "",
             timestamp=timestamp,
         )
-        record = result.single()
         if record and record["e"]:
             node = record["e"]
             return {
@@ -102,14 +167,49 @@ def add_evidence(
     return None
 
 
-def create_link(
+async def add_evidence_bulk(
+    session: Neo4jSession,
+    case_id: str,
+    rows: list[dict[str, Any]],
+) -> int:
+    """
+    Create many Evidence nodes under a Case in a single UNWIND write transaction.
+    rows: same shape as add_evidence's evidence_data. Returns the number of rows written.
+    """
+    params = []
+    for row in rows:
+        eid = row.get("id", "")
+        if not eid:
+            continue
+        content = row.get("content", "") or row.get("url", "")
+        timestamp = row.get("timestamp")
+        params.append({
+            "id": eid,
+            "type": row.get("type", "text"),
+            "content": content[:10000] if isinstance(content, str) else str(content)[:10000],
+            "url": row.get("url") or "",
+            "timestamp": str(timestamp) if timestamp is not None else None,
+        })
+    if not params:
+        return 0
+
+    try:
+        record = await session.execute_write(_single, _ADD_EVIDENCE_BULK_QUERY, case_id=case_id, rows=params)
+        return record["n"] if record else 0
+    except Exception as e:
+        logger.exception("add_evidence_bulk failed: %s", e)
+    return 0
+
+
+async def create_link(
     session: Neo4jSession,
     case_id: str,
     edge_data: dict[str, Any],
 ) -> dict[str, Any] | None:
     """
-    Create a RELATED edge between two Node nodes (Red String — manual link).
-    Returns source, target, relation data for event emission.
+    Create a RELATED edge between two Node nodes of the case (Red String — manual link).
+    Returns source, target, relation data for event emission; None if either endpoint
+    is missing from the case (nothing is written then).
     """
     source_id = edge_data.get("source_id", "")
     target_id = edge_data.get("target_id", "")
@@ -120,22 +220,19 @@ def create_link(
         logger.warning("create_link: missing source_id or target_id")
         return None
 
-    query = """
-    MATCH (a:Node {id: $source_id}), (b:Node {id: $target_id})
-    MERGE (a)-[r:RELATED {type: $type}]->(b)
-    SET r.created_at = datetime(), r.note = $note, r.manual = true
-    RETURN a, b, r
-    """
     try:
-        result = session.run(
-            query,
+        record = await session.execute_write(
+            _single,
+            _CREATE_LINK_QUERY,
+            case_id=case_id,
             source_id=source_id,
             target_id=target_id,
             type=rel_type,
             note=note,
         )
-        record = result.single()
-        if record and record["a"] and record["b"] and record["r"]:
+        if record is None:
+            logger.warning("create_link: %s or %s not found in case %s", source_id, target_id, case_id)
+        elif record["a"] and record["b"] and record["r"]:
             a, b, r = record["a"], record["b"], record["r"]
             return {
                 "source": {
@@ -162,100 +259,132 @@ def create_link(
     return None
 
 
-def get_case_graph(session: Neo4jSession, case_id: str) -> dict[str, Any] | None:
+async def create_links_bulk(
+    session: Neo4jSession,
+    case_id: str,
+    edges: list[dict[str, Any]],
+) -> int:
+    """
+    Create many RELATED edges in a single UNWIND write transaction.
+    edges: same shape as create_link's edge_data. Returns the number of edges written.
     """
-    Fetch full case graph from Neo4j. Returns React Flow format:
-    { nodes: [{ id, position: {x,y}, data: { label, type, ... } }], edges: [{ id, source, target, type, ... }] }
+    pairs = [
+        {
+            "source_id": e["source_id"],
+            "target_id": e["target_id"],
+            "type": e.get("type", "SUSPECTED_LINK"),
+            "note": e.get("note") or "",
+        }
+        for e in edges
+        if e.get("source_id") and e.get("target_id")
+    ]
+    if not pairs:
+        return 0
+
+    try:
+        record = await session.execute_write(_single, _CREATE_LINKS_BULK_QUERY, case_id=case_id, pairs=pairs)
+        return record["n"] if record else 0
+    except Exception as e:
+        logger.exception("create_links_bulk failed for case %s: %s", case_id, e)
+    return 0
+
+
+def _flow_node(node: Any, i: int, n_nodes: int) -> dict[str, Any]:
+    """Format one Neo4j node for React Flow, placed on a simple circular layout."""
+    nid = str(node["id"])
+    angle = 2 * math.pi * i / max(n_nodes, 1)
+    x = 250 + 200 * math.cos(angle)
+    y = 250 + 200 * math.sin(angle)
+
+    # Build data from node properties
+    data: dict[str, Any] = {"label": nid}
+    labels = list(node.labels) if hasattr(node, "labels") else []
+    if labels:
+        data["nodeType"] = labels[0].lower()
+    for key in ("type", "content", "url", "timestamp"):
+        if node.get(key) is not None:
+            data[key] = str(node[key])
+
+    return {
+        "id": nid,
+        "position": {"x": round(x, 2), "y": round(y, 2)},
+        "data": data,
+    }
+
+
+def _flow_edge(rel: Any, i: int) -> dict[str, Any] | None:
+    """Format one Neo4j relationship for React Flow; None if an endpoint has no id."""
+    start_node = rel.start_node if hasattr(rel, "start_node") else None
+    end_node = rel.end_node if hasattr(rel, "end_node") else None
+    if not start_node or not end_node:
+        return None
+    sid = str(start_node["id"]) if start_node.get("id") else None
+    tid = str(end_node["id"]) if end_node.get("id") else None
+    if not sid or not tid:
+        return None
+    eid = getattr(rel, "element_id", None) or f"e-{sid}-{tid}-{i}"
+
+    edge_obj: dict[str, Any] = {
+        "id": eid[:80],
+        "source": sid,
+        "target": tid,
+        "type": getattr(rel, "type", "RELATED"),
+    }
+    if rel.get("note"):
+        edge_obj["data"] = {"note": rel.get("note")}
+    return edge_obj
+
+
+async def count_case_graph_nodes(session: Neo4jSession, case_id: str) -> int | None:
+    """Number of nodes stream_case_graph will yield (needed up front for the layout). None on failure."""
+    try:
+        record = await session.execute_read(_single, _COUNT_CASE_NODES_QUERY, case_id=case_id)
+        return record["n"] if record else 0
+    except Exception as e:
+        logger.exception("count_case_graph_nodes failed: %s", e)
+    return None
+
+
+async def stream_case_graph(
+    session: Neo4jSession, case_id: str, n_nodes: int
+) -> AsyncIterator[bytes]:
     """
-    query = """
-    MATCH (c:Case {id: $case_id})-[:CONTAINS]->(n)
-    OPTIONAL MATCH (n)-[r]-(m)
-    WHERE (c)-[:CONTAINS]->(m) OR m:Inference
-    RETURN collect(DISTINCT n) AS nodes, collect(DISTINCT r) AS edges, collect(DISTINCT m) AS inferences
+    Stream the case graph from Neo4j as one React Flow JSON document:
+    { case_id, nodes: [{ id, position: {x,y}, data: { label, type, ... } }], edges: [{ id, source, target, type, ... }] }
+    Records are consumed from the cursor one at a time, so memory stays flat regardless of graph size.
     """
+    yield b'{"case_id":' + to_json(case_id) + b',"nodes":['
     try:
-        result = session.run(query, case_id=case_id)
-        record = result.single()
-        if not record:
-            return {"nodes": [], "edges": []}
-
-        raw_nodes = record["nodes"] or []
-        raw_edges = record["edges"] or []
-        raw_inferences = record["inferences"] or []
-
-        # Merge nodes and inferences, dedupe by id, filter nulls
-        seen_ids: set[str] = set()
-        all_raw: list[Any] = []
-        for node in raw_nodes + raw_inferences:
-            if node is not None and hasattr(node, "get") and node.get("id"):
-                nid = str(node["id"])
-                if nid not in seen_ids:
-                    seen_ids.add(nid)
-                    all_raw.append(node)
-
-        # Build node id -> index for layout
-        node_list = list(all_raw)
-        if not node_list and not raw_edges:
-            return {"nodes": [], "edges": []}
-
-        # Simple circular layout for React Flow
-        n_nodes = len(node_list)
-        nodes_flow: list[dict[str, Any]] = []
-        for i, node in enumerate(node_list):
-            nid = str(node["id"])
-            angle = 2 * math.pi * i / max(n_nodes, 1)
-            x = 250 + 200 * math.cos(angle)
-            y = 250 + 200 * math.sin(angle)
-
-            # Build data from node properties
-            data: dict[str, Any] = {"label": nid}
-            labels = list(node.labels) if hasattr(node, "labels") else []
-            if labels:
-                data["nodeType"] = labels[0].lower()
-            for key in ("type", "content", "url", "timestamp"):
-                if node.get(key) is not None:
-                    val = node[key]
-                    data[key] = str(val) if val is not None else None
-
-            nodes_flow.append({
-                "id": nid,
-                "position": {"x": round(x, 2), "y": round(y, 2)},
-                "data": data,
-            })
-
-        # Build edges for React Flow
-        seen_edge_ids: set[str] = set()
-        edges_flow: list[dict[str, Any]] = []
-        for i, rel in enumerate(raw_edges):
+        sep = b""
+        result = await session.run(_CASE_NODES_QUERY, case_id=case_id)
+        i = 0
+        async for record in result:
+            node = record["n"]
+            if node is None or not node.get("id"):
+                continue
+            yield sep + to_json(_flow_node(node, i, n_nodes))
+            sep = b","
+            i += 1
+
+        yield b'],"edges":['
+        sep = b""
+        result = await session.run(_CASE_EDGES_QUERY, case_id=case_id)
+        i = 0
+        async for record in result:
+            rel = record["r"]
             if rel is None:
                 continue
             try:
-                start_node = rel.start_node if hasattr(rel, "start_node") else None
-                end_node = rel.end_node if hasattr(rel, "end_node") else None
-                if not start_node or not end_node:
-                    continue
-                sid = str(start_node["id"]) if start_node.get("id") else None
-                tid = str(end_node["id"]) if end_node.get("id") else None
-                if not sid or not tid or sid not in seen_ids or tid not in seen_ids:
-                    continue
-                eid = getattr(rel, "element_id", None) or f"e-{sid}-{tid}-{i}"
-                if eid in seen_edge_ids:
-                    continue
-                seen_edge_ids.add(eid)
-
-                edge_obj: dict[str, Any] = {
-                    "id": eid[:80],
-                    "source": sid,
-                    "target": tid,
-                    "type": getattr(rel, "type", "RELATED"),
-                }
-                if rel.get("note"):
-                    edge_obj["data"] = {"note": rel.get("note")}
-                edges_flow.append(edge_obj)
+                edge_obj = _flow_edge(rel, i)
             except Exception as e:
                 logger.warning("Skipping edge: %s", e)
-
-        return {"nodes": nodes_flow, "edges": edges_flow}
+                continue
+            i += 1
+            if edge_obj:
+                yield sep + to_json(edge_obj)
+                sep = b","
     except Exception as e:
-        logger.exception("get_case_graph failed: %s", e)
-    return None
+        # Headers are already sent; a truncated body is the only signal left to the client
+        logger.exception("stream_case_graph failed: %s", e)
+        raise
+    yield b"]}"
@@ -8,6 +8,7 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 _client = None
+_async_client = None
 
 
 def _get_client():
@@ -23,6 +24,27 @@ def _get_client():
     return _client
 
 
+def get_async_client():
+    """Shared async GROQ client for request handlers. Created once (at startup via lifespan), then reused."""
+    global _async_client
+    if _async_client is None and settings.groq_api_key:
+        try:
+            from groq import AsyncGroq
+            _async_client = AsyncGroq(api_key=settings.groq_api_key)
+            logger.info("Async GROQ client initialized")
+        except Exception as e:
+            logger.warning(f"Async GROQ client initialization failed: {e}")
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Close the shared async client's connection pool. Call on application shutdown."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.close()
+        _async_client = None
+
+
 def is_available() -> bool:
     """Check if GROQ client is available."""
     return _get_client() is not None
@@ -49,7 +71,7 @@ async def extract_claims(report_text: str) -> dict[str, Any]:
     client = _get_client()
     if not client:
         logger.warning("GROQ client unavailable for extract_claims")
-        return _mock_claims(report_text)
+        return mock_claims(report_text)
 
     try:
         response = client.chat.completions.create(
@@ -71,7 +93,7 @@ async def extract_claims(report_text: str) -> dict[str, Any]:
 
     except Exception as e:
         logger.warning(f"GROQ extract_claims failed: {e}")
-        return _mock_claims(report_text)
+        return mock_claims(report_text)
 
 
 async def compose_alert(case_context: str, officer_notes: str | None = None) -> str:
@@ -79,7 +101,7 @@ async def compose_alert(case_context: str, officer_notes: str | None = None) ->
     client = _get_client()
     if not client:
         logger.warning("GROQ client unavailable for compose_alert")
-        return _mock_alert_draft()
+        return mock_alert_draft()
 
     try:
         prompt = f"{ALERT_COMPOSER_PROMPT}\n\nCase context:\n{case_context}"
@@ -102,7 +124,7 @@ async def compose_alert(case_context: str, officer_notes: str | None = None) ->
 
     except Exception as e:
         logger.warning(f"GROQ compose_alert failed: {e}")
-        return _mock_alert_draft()
+        return mock_alert_draft()
 
 
 async def generate_search_queries(claims: list[dict[str, Any]]) -> list[str]:
@@ -113,7 +135,7 @@ async def generate_search_queries(claims: list[dict[str, Any]]) -> list[str]:
         return _mock_search_queries()
 
     try:
-        claims_str = json.dumps(claims, indent=2)
+        claims_str = json.dumps(claims, separators=(",", ":"))
 
         response = client.chat.completions.create(
             model="llama-3.1-8b-instant",
@@ -136,12 +158,17 @@ async def generate_search_queries(claims: list[dict[str, Any]]) -> list[str]:
         return _mock_search_queries()
 
 
+# Placeholder texts generate_narrative returns instead of raising
+NARRATIVE_UNAVAILABLE = "Narrative generation unavailable"
+NARRATIVE_FAILED = "Narrative generation failed"
+
+
 async def generate_narrative(prompt: str) -> str:
     """Generate case narrative using GROQ Llama 3.3 70B."""
     client = _get_client()
     if not client:
         logger.warning("GROQ client unavailable")
-        return "Narrative generation unavailable"
+        return NARRATIVE_UNAVAILABLE
 
     try:
         response = client.chat.completions.create(
@@ -160,7 +187,7 @@ async def generate_narrative(prompt: str) -> str:
 
     except Exception as e:
         logger.warning(f"GROQ generate_narrative failed: {e}")
-        return "Narrative generation failed"
+        return NARRATIVE_FAILED
 
 
 def _parse_claims_json(text: str) -> dict[str, Any]:
@@ -173,7 +200,7 @@ def _parse_claims_json(text: str) -> dict[str, Any]:
         return json.loads(text)
     except json.JSONDecodeError:
         pass
-    return _mock_claims("")
+    return mock_claims("")
 
 
 def _parse_search_queries(text: str) -> list[str]:
@@ -188,7 +215,8 @@ def _parse_search_queries(text: str) -> list[str]:
     return queries[:3] if queries else _mock_search_queries()
 
 
-def _mock_claims(report_text: str) -> dict[str, Any]:
+def mock_claims(report_text: str) -> dict[str, Any]:
+    """Placeholder claims returned when extraction is unavailable or fails."""
     return {
         "claims": [{"statement": report_text[:200] or "Unknown claim", "confidence": 0.5, "category": "other"}],
         "urgency": 0.5,
@@ -197,7 +225,8 @@ def _mock_claims(report_text: str) -> dict[str, Any]:
     }
 
 
-def _mock_alert_draft() -> str:
+def mock_alert_draft() -> str:
+    """Placeholder alert returned when composition is unavailable or fails."""
     return "Campus Safety Notice: We are investigating a reported incident. Please avoid the area until further notice. Check official channels for updates."
 
 
@@ -228,7 +257,7 @@ async def analyze_image_forensics_from_description(
         # Build context string
         context_str = ""
         if evidence_context.get("claims"):
-            context_str += f"\nReported Claims: {json.dumps(evidence_context['claims'])}"
+            context_str += f"\nReported Claims: {json.dumps(evidence_context['claims'], separators=(',', ':'))}"
         if evidence_context.get("location"):
             context_str += f"\nLocation: {evidence_context['location']}"
         if evidence_context.get("entities"):
@@ -327,7 +356,7 @@ async def analyze_video_deepfake(
         # Build context string
         context_str = ""
         if evidence_context.get("claims"):
-            context_str += f"\nReported Claims: {json.dumps(evidence_context['claims'])}"
+            context_str += f"\nReported Claims: {json.dumps(evidence_context['claims'], separators=(',', ':'))}"
         if evidence_context.get("location"):
             context_str += f"\nLocation: {evidence_context['location']}"
         if evidence_context.get("entities"):
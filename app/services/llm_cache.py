@@ -0,0 +1,88 @@
+"""In-process cache for LLM responses, keyed by a hash of the normalized prompt."""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Calls currently running per key. Lookup and insert happen without an await in between,
+# so the event loop alone keeps them atomic and no lock is needed.
+_inflight: dict[Hashable, asyncio.Task] = {}
+
+_WHITESPACE_TABLE = str.maketrans({"\t": " ", "\r": " ", "\n": " "})
+
+
+def prompt_key(*parts: str) -> str:
+    """SHA-256 of the prompt parts with runs of whitespace collapsed.
+
+    Letter case is kept: claims and alerts echo their input, so prompts that differ
+    only in case must not share a response.
+    """
+    text = "\x1f".join(" ".join(p.translate(_WHITESPACE_TABLE).split()) for p in parts)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Bounded LRU of LLM responses with an optional per-entry TTL (seconds)."""
+
+    def __init__(self, maxsize: int, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if self.ttl is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+async def cached(
+    cache: ResponseCache,
+    key: str,
+    loader: Callable[[], Awaitable[T]],
+    keep: Callable[[T], bool] = bool,
+) -> T:
+    """Return the cached value for key, else await loader() and cache its result when keep() accepts it."""
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+
+    async def load() -> T:
+        value = await loader()
+        if keep(value):
+            cache.set(key, value)
+        return value
+
+    return await single_flight((id(cache), key), load)
+
+
+async def single_flight(key: Hashable, coro_factory: Callable[[], Awaitable[T]]) -> T:
+    """Run coro_factory() once per key at a time; concurrent callers with the same key await that call.
+
+    The shared call is shielded, so a cancelled caller does not cancel it for the others.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(coro_factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
@@ -1,5 +1,7 @@
 """Noir-themed case ID generation."""
 import random
+import secrets
+import time
 import uuid
 
 ADJECTIVES = [
@@ -38,6 +40,22 @@ def generate_edge_id() -> str:
     return f"E-{uuid.uuid4().hex[:12].upper()}"
 
 
+def generate_edge_ids(n: int) -> list[str]:
+    """Generate n edge IDs (same format as generate_edge_id) from one random read."""
+    raw = secrets.token_hex(6 * n).upper()
+    return [f"E-{raw[i:i + 12]}" for i in range(0, 12 * n, 12)]
+
+
 def generate_alert_id() -> str:
     """Generate unique alert ID."""
     return f"ALT-{uuid.uuid4().hex[:12].upper()}"
+
+
+def generate_job_id() -> str:
+    """Generate unique background job ID."""
+    return f"JOB-{uuid.uuid4().hex[:12].upper()}"
+
+
+def generate_evidence_id() -> str:
+    """Generate evidence ID: ev-{epoch ms}-{6 hex}."""
+    return f"ev-{time.time_ns() // 1_000_000}-{secrets.token_hex(3)}"
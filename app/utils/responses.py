@@ -0,0 +1,16 @@
+"""JSON response class backed by pydantic-core's Rust encoder."""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that renders with pydantic_core.to_json instead of json.dumps.
+
+    Handles datetime, enums and pydantic models natively, so handlers can
+    return model_dump() without mode="json".
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,38 @@
+"""Chat evidence context stays within its prompt budget."""
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from app.routers.cases import MAX_CHAT_CONTEXT_CHARS, _chat_context_json  # noqa: E402
+
+
+def _item(i: int, size: int) -> dict:
+    return {
+        "id": f"ev-{i}",
+        "content": "x" * size,
+        "claims": [{"statement": "y" * size, "confidence": 0.5, "category": "other"}],
+        "forensics": {"reasoning": "z" * size},
+    }
+
+
+def test_small_context_is_unchanged():
+    context = [_item(0, 10)]
+    assert json.loads(_chat_context_json(context)) == [_item(0, 10)]
+
+
+def test_oversized_claims_and_many_items_stay_within_budget():
+    context = [_item(i, 3000) for i in range(50)]
+    out = _chat_context_json(context)
+    assert len(out) <= MAX_CHAT_CONTEXT_CHARS
+    kept = json.loads(out)
+    assert kept and kept[0]["id"] == "ev-0"
+    assert all(len(item["content"]) <= 500 for item in kept)
+
+
+def test_single_item_too_large_on_its_own_drops_claims_and_forensics():
+    context = [_item(0, MAX_CHAT_CONTEXT_CHARS * 2)]
+    out = _chat_context_json(context)
+    assert len(out) <= MAX_CHAT_CONTEXT_CHARS
+    assert json.loads(out) == [{"id": "ev-0", "content": "x" * 500, "claims": [], "forensics": {}}]